@@ -23,20 +23,26 @@ import argparse
 from pathlib import Path
 from typing import Any, Dict, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 
 # -----------------------------------------------------------------------------
 # Helper: safe division that returns NaN instead of raising on zero
 # -----------------------------------------------------------------------------
-def _safediv(numer: Union[pd.Series, float], denom: Union[pd.Series, float]) -> pd.Series:
+def _safediv(numer: Union[pd.Series, float], denom: Union[pd.Series, float]) -> np.ndarray:
     """
-    Safe divide that returns NaN when denominator is 0 or NaN.
+    Safe divide that never raises on zero/NaN denominators (0/0 → NaN, x/0 → inf).
 
     Why:
-    - Real project data often has 0 PV/AC early in a period; we prefer NaN over crash.
+    - Real project data often has 0 PV/AC early in a period; we prefer NaN/inf over crash.
+    - Works on whole columns via a single NumPy ufunc pass (no per-row Python calls,
+      no temporary Series allocations).
     """
-    return pd.Series(numer, dtype="float64") / pd.Series(denom, dtype="float64")
+    num = np.asarray(numer, dtype="float64")
+    den = np.asarray(denom, dtype="float64")
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.asarray(num / den)
 
 
 # -----------------------------------------------------------------------------
@@ -102,16 +108,23 @@ def _compute_metrics_timeseries(schedule_df: pd.DataFrame, cost_df: pd.DataFrame
         ProjectID, WBS, Period, EV, PV, AC, BAC, CPI, SPI, EAC, VAC, CV, SV
     """
     # --- 1) Normalize inputs and coerce numerics (handles messy CSVs) ----------
-    sched = schedule_df.copy()
-    cost = cost_df.copy()
-
-    # Coerce numeric columns; blank/None become NaN then treated as 0 by groupby sum
-    for col in ["PercentComplete", "BAC"]:
-        if col in sched.columns:
-            sched[col] = pd.to_numeric(sched[col], errors="coerce")
-    for col in ["ActualCost", "Budget"]:
-        if col in cost.columns:
-            cost[col] = pd.to_numeric(cost[col], errors="coerce")
+    # assign() returns a shallow copy that shares untouched columns with the
+    # caller's frame — only the coerced columns are materialized, no full copy.
+    # Blank/None become NaN then treated as 0 by groupby sum.
+    sched = schedule_df.assign(
+        **{
+            col: pd.to_numeric(schedule_df[col], errors="coerce")
+            for col in ("PercentComplete", "BAC")
+            if col in schedule_df.columns
+        }
+    )
+    cost = cost_df.assign(
+        **{
+            col: pd.to_numeric(cost_df[col], errors="coerce")
+            for col in ("ActualCost", "Budget")
+            if col in cost_df.columns
+        }
+    )
 
     # Enforce required ID columns
     required_sched = {"ProjectID", "WBS", "PercentComplete", "BAC"}
@@ -125,8 +138,10 @@ def _compute_metrics_timeseries(schedule_df: pd.DataFrame, cost_df: pd.DataFrame
 
     # --- 2) EV/BAC per WBS -----------------------------------------------------
     # EV is independent of Period in this simple view; we’ll join it later to each Period row.
+    # Keep the group keys as the index so step 4 can use an index-aligned join
+    # instead of a hash merge.
     ev_wbs = (
-        sched.groupby(["ProjectID", "WBS"], as_index=False)
+        sched.groupby(["ProjectID", "WBS"], observed=True)
         .agg({"PercentComplete": "mean", "BAC": "sum"})
         .rename(columns={"PercentComplete": "Pct"})
     )
@@ -136,21 +151,30 @@ def _compute_metrics_timeseries(schedule_df: pd.DataFrame, cost_df: pd.DataFrame
     # Aggregate Budget (PV) and ActualCost (AC) per period.
     cost["Period"] = cost["Period"].astype(str)
     pv_ac = (
-        cost.groupby(["ProjectID", "WBS", "Period"], as_index=False)
+        cost.groupby(["ProjectID", "WBS", "Period"], as_index=False, observed=True)
         .agg({"Budget": "sum", "ActualCost": "sum"})
         .rename(columns={"Budget": "PV", "ActualCost": "AC"})
     )
 
     # --- 4) Join EV/BAC into time-phased table --------------------------------
-    out = pv_ac.merge(ev_wbs, on=["ProjectID", "WBS"], how="left")
+    # Index-aligned left join on the group keys; cheaper than a hash merge and
+    # skips the intermediate merged frame.
+    out = pv_ac.join(ev_wbs[["EV", "BAC"]], on=["ProjectID", "WBS"])
 
     # --- 5) KPIs: CPI, SPI, EAC, VAC, CV, SV ----------------------------------
-    out["CPI"] = _safediv(out["EV"], out["AC"])
-    out["SPI"] = _safediv(out["EV"], out["PV"])
-    out["EAC"] = out["AC"] + (out["BAC"] - out["EV"])
-    out["VAC"] = out["BAC"] - out["EAC"]
-    out["CV"] = out["EV"] - out["AC"]
-    out["SV"] = out["EV"] - out["PV"]
+    # Compute on raw NumPy columns: one ufunc pass per KPI, no row-wise Python.
+    ev = out["EV"].to_numpy(dtype="float64")
+    pv = out["PV"].to_numpy(dtype="float64")
+    ac = out["AC"].to_numpy(dtype="float64")
+    bac = out["BAC"].to_numpy(dtype="float64")
+
+    eac = ac + (bac - ev)
+    out["CPI"] = _safediv(ev, ac)
+    out["SPI"] = _safediv(ev, pv)
+    out["EAC"] = eac
+    out["VAC"] = bac - eac
+    out["CV"] = ev - ac
+    out["SV"] = ev - pv
 
     # Ensure column order is friendly and deterministic
     cols = [
@@ -222,8 +246,16 @@ def _read_inputs(samples_dir: Path) -> Tuple[pd.DataFrame, pd.DataFrame]:
     if not cost_fp.exists():
         raise FileNotFoundError(f"Missing {cost_fp}")
 
-    schedule_df = pd.read_csv(sched_fp)
-    cost_df = pd.read_csv(cost_fp)
+    # pyarrow engine parses in parallel across cores (default C engine is single-threaded)
+    schedule_df = pd.read_csv(sched_fp, engine="pyarrow")
+    cost_df = pd.read_csv(cost_fp, engine="pyarrow")
+
+    # Dictionary-encode the repeated ID strings: groupby hashes int codes instead
+    # of Python strings, and parquet preserves the dtype for downstream readers.
+    for df in (schedule_df, cost_df):
+        for col in ("ProjectID", "WBS"):
+            if col in df.columns:
+                df[col] = df[col].astype("category")
     return schedule_df, cost_df
 
 
@@ -234,8 +266,9 @@ def _write_output(df: pd.DataFrame, out_dir: Path) -> Path:
     """
     out_dir.mkdir(parents=True, exist_ok=True)
     out_fp = out_dir / "evm_timeseries.parquet"
-    # Use to_parquet; if engine is missing, users can install pyarrow/fastparquet.
-    df.to_parquet(out_fp, index=False)
+    # zstd + bounded row groups: fewer bytes for the downstream readers
+    # (monte_carlo, alerts, narratives) and column-projection pushdown.
+    df.to_parquet(out_fp, index=False, engine="pyarrow", compression="zstd", compression_level=3, row_group_size=65536)
     return out_fp
 
 
@@ -21,10 +21,73 @@
 # -----------------------------------------------------------------------------
 
 import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Callable, Optional
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+
+njit: Optional[Callable[..., Any]]
+try:
+    # Optional accelerator: JIT-compiles the hot array math below (SIMD + threads).
+    from numba import njit as _numba_njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+else:
+    njit = _numba_njit
+
+# Writer tuning shared by all outputs: zstd moves ~30-50% fewer bytes than the
+# snappy default, and bounded row groups let readers push down column projection.
+_PARQUET_KWARGS = {"engine": "pyarrow", "compression": "zstd", "compression_level": 3, "row_group_size": 65536}
+
+# Iterations are split across this many independent RNG streams. Fixed (rather
+# than cpu_count) so a given seed reproduces the same draws on any machine;
+# the thread pool just uses however many cores are actually available.
+_MC_CHUNKS = 8
+
+
+def _pert_params(low, mode, high):
+    """
+    Derive Beta (a, b) parameters and the epsilon-nudged high bound from
+    (low, mode, high) PERT inputs. Pure array math, so it JIT-compiles cleanly.
+    """
+    eps = 1e-9
+    # Ensure high > low to avoid division by zero; nudge ties by epsilon
+    high = np.where(high <= low, low + eps, high)
+
+    # Classic PERT → Beta with parameters a,b computed from (low, mode, high)
+    span = high - low
+    a = 1.0 + 4.0 * (mode - low) / span
+    b = 1.0 + 4.0 * (high - mode) / span
+
+    # Keep parameters strictly positive
+    return np.maximum(a, eps), np.maximum(b, eps), high
+
+
+def _sorted_quantiles(s, qs):
+    """
+    Linear-interpolated quantiles from an ALREADY-SORTED 1-D array — the same
+    interpolation np.quantile/pandas use, minus their internal partition pass.
+    """
+    pos = qs * (len(s) - 1)
+    lo = np.floor(pos).astype(np.int64)
+    hi = np.minimum(lo + 1, len(s) - 1)
+    frac = pos - lo
+    return s[lo] * (1.0 - frac) + s[hi] * frac
+
+
+def _combine_eac(eb, per_iter_delta):
+    """Broadcast per-project baselines against per-iteration deltas → (P, iters)."""
+    return eb.reshape(-1, 1) + per_iter_delta.reshape(1, -1)
+
+
+if njit is not None:  # compile once, reuse across calls
+    _pert_params = njit(parallel=True, fastmath=True, cache=True)(_pert_params)
+    _combine_eac = njit(parallel=True, fastmath=True, cache=True)(_combine_eac)
 
 
 def pert(low, mode, high, size, rng):
@@ -54,25 +117,70 @@ def pert(low, mode, high, size, rng):
     mode = np.asarray(pd.to_numeric(mode, errors="coerce"), dtype=float)
     high = np.asarray(pd.to_numeric(high, errors="coerce"), dtype=float)
 
-    # Ensure high > low to avoid division by zero; nudge ties by epsilon
-    eps = 1e-9
-    high = np.where(high <= low, low + eps, high)
-
-    # Classic PERT → Beta with parameters a,b computed from (low, mode, high)
-    a = 1.0 + 4.0 * (mode - low) / (high - low)
-    b = 1.0 + 4.0 * (high - mode) / (high - low)
-
-    # Keep parameters strictly positive
-    a = np.clip(a, eps, None)
-    b = np.clip(b, eps, None)
+    a, b, high = _pert_params(low, mode, high)
 
-    # rng.beta broadcasts (a,b) across the requested size
-    beta_samples = rng.beta(a, b, size=size)
+    # Sample Beta(a, b) as X/(X+Y) with X~Gamma(a), Y~Gamma(b). standard_gamma
+    # broadcasts (a, b) across the requested size like rng.beta did, but takes
+    # the generator's faster bulk-sampling path for large batches.
+    x = rng.standard_gamma(a, size=size)
+    y = rng.standard_gamma(b, size=size)
+    denom = x + y
+    with np.errstate(invalid="ignore"):
+        beta_samples = np.where(denom > 0, x / denom, 0.5)
 
     # Scale Beta(0..1) back to [low, high] per risk
     return low + (high - low) * beta_samples
 
 
+def _pert_fill(rng, low, mode, high, out, tmp):
+    """
+    In-place variant of pert() for the hot loop: samples into the
+    preallocated `out`/`tmp` float64 buffers instead of allocating fresh
+    (iters, n_risks) temporaries per call. Inputs must already be numeric
+    arrays/scalars (no CSV coercion here). Returns `out`.
+    """
+    a, b, high = _pert_params(low, mode, high)
+    rng.standard_gamma(a, size=out.shape, out=out)  # X ~ Gamma(a)
+    rng.standard_gamma(b, size=tmp.shape, out=tmp)  # Y ~ Gamma(b)
+    np.add(out, tmp, out=tmp)  # tmp = X + Y
+    with np.errstate(invalid="ignore", divide="ignore"):
+        np.divide(out, tmp, out=out)  # Beta = X / (X + Y)
+    np.copyto(out, 0.5, where=tmp <= 0)  # degenerate draws, as in pert()
+    np.multiply(out, high - low, out=out)  # scale back to [low, high]
+    np.add(out, low, out=out)
+    return out
+
+
+def _sample_impacts(rng, iters, prob, cost_params, days_params, proc_params):
+    """
+    Draw one chunk of iterations: probability gates, PERT cost/schedule
+    impacts reduced across risks, and procurement delay days.
+
+    Pure NumPy block — the GIL is released inside the generator and ufunc
+    calls, so chunks overlap when dispatched on threads.
+    """
+    n = len(prob)
+    # Empty register (or empty chunk): no gated impacts to draw — skip the
+    # (iters, n) matrix work entirely and only sample the procurement delay.
+    if n == 0 or iters == 0:
+        zeros = np.zeros(iters)
+        return zeros, zeros.copy(), pert(*proc_params, iters, rng)
+    # float32 uniforms: half the memory traffic of float64 for the gate
+    # compare, and far more precision than a probability gate needs
+    gates = rng.random((iters, n), dtype=np.float32) <= prob
+    # Two shared buffers serve both PERT draws: the cost samples are reduced
+    # before the schedule draw overwrites them, so each chunk allocates one
+    # (iters, n) pair total instead of fresh temporaries per pert() call.
+    buf = np.empty((iters, n))
+    tmp = np.empty((iters, n))
+    # Masked reduction: sums only gated samples without materializing the
+    # (iters, n) product array the old `(cost * gates).sum(axis=1)` built.
+    cost_imp = np.sum(_pert_fill(rng, *cost_params, buf, tmp), axis=1, where=gates)  # shape: (iters,)
+    days_imp = np.sum(_pert_fill(rng, *days_params, buf, tmp), axis=1, where=gates)  # shape: (iters,)
+    pdays = pert(*proc_params, iters, rng)  # shape: (iters,)
+    return cost_imp, days_imp, pdays
+
+
 def run(iters, seed, processed_dir, samples_dir, outdir):
     """
     Main Monte Carlo driver.
@@ -88,23 +196,38 @@ def run(iters, seed, processed_dir, samples_dir, outdir):
            - Compute EAC distribution and FinishDaysOverBaseline per iteration.
       5) Save iteration runs, summary percentiles, and EAC CDF S-curve points.
     """
-    rng = np.random.default_rng(seed)
+    # SFC64 is the fastest bit generator NumPy ships; the sim is bound on
+    # variate generation, so cheaper 64-bit words shave the whole hot path.
+    # MC_BITGEN=pcg64 selects PCG64 for anyone comparing against older runs.
+    bitgen = np.random.PCG64 if os.environ.get("MC_BITGEN", "").lower() == "pcg64" else np.random.SFC64
+
+    # One non-overlapping child stream per iteration chunk (reproducible for a
+    # given seed regardless of how many threads actually run them).
+    n_chunks = max(1, min(_MC_CHUNKS, iters))
+    rngs = [np.random.Generator(bitgen(child)) for child in np.random.SeedSequence(seed).spawn(n_chunks)]
+    chunk_sizes = [iters // n_chunks + (1 if i < iters % n_chunks else 0) for i in range(n_chunks)]
 
     processed_dir = Path(processed_dir)
     samples_dir = Path(samples_dir)
     outdir = Path(outdir)
     outdir.mkdir(parents=True, exist_ok=True)
 
-    # ---- 1) Baseline EVM ----
-    evm = pd.read_parquet(processed_dir / "evm_timeseries.parquet")
+    # ---- 1) Baseline EVM (only the three columns the baseline needs) ----
+    evm = pd.read_parquet(processed_dir / "evm_timeseries.parquet", columns=["ProjectID", "EAC", "BAC"])
 
     # Derive a baseline per project (use mean of latest EAC/BAC as a simple proxy)
     base = (
-        evm.groupby("ProjectID", as_index=False).agg({"EAC": "mean", "BAC": "mean"}).rename(columns={"EAC": "EAC_base"})
+        evm.groupby("ProjectID", as_index=False, observed=True)
+        .agg({"EAC": "mean", "BAC": "mean"})
+        .rename(columns={"EAC": "EAC_base"})
     )
 
-    # ---- 2) Risk Register (coerce numerics) ----
-    risks = pd.read_csv(samples_dir / "risk_register.csv")
+    # ---- 2) Risk Register ----
+    # Typed Arrow CSV read: the schema is declared up front, so there is no
+    # dtype-inference scan and no per-column to_numeric pass afterwards.
+    # include_missing_columns covers registers lacking some parameter columns
+    # (Arrow fills them with typed nulls); blanks/nulls then zero out in one
+    # fillna, matching the old coercion defaults.
     num_cols = [
         "Probability",
         "CostLow",
@@ -114,114 +237,142 @@ def run(iters, seed, processed_dir, samples_dir, outdir):
         "SchedDaysML",
         "SchedDaysHigh",
     ]
-    for c in num_cols:
-        if c in risks.columns:
-            risks[c] = pd.to_numeric(risks[c], errors="coerce").fillna(0.0)
-        else:
-            # If a column is missing, add zeros so code still runs
-            risks[c] = 0.0
+    risks = (
+        pv.read_csv(
+            samples_dir / "risk_register.csv",
+            convert_options=pv.ConvertOptions(
+                column_types={c: pa.float64() for c in num_cols},
+                include_columns=num_cols,
+                include_missing_columns=True,
+                strings_can_be_null=True,
+            ),
+        )
+        .to_pandas()
+        .fillna(0.0)
+    )
 
     # ---- 3) Procurement delays → a simple delay-days distribution ----
     if (samples_dir / "procurement.csv").exists():
-        proc = pd.read_csv(
+        # Only the two delivery-date columns matter here; a projected, typed
+        # Arrow read skips the Item/Vendor/Qty/etc. columns and the pandas
+        # to_datetime pass entirely.
+        tbl = pv.read_csv(
             samples_dir / "procurement.csv",
-            parse_dates=["PlannedDelivery", "ActualDelivery"],
+            convert_options=pv.ConvertOptions(
+                include_columns=["PlannedDelivery", "ActualDelivery"],
+                column_types={"PlannedDelivery": pa.timestamp("s"), "ActualDelivery": pa.timestamp("s")},
+            ),
         )
-        proc["DelayDays"] = (proc["ActualDelivery"] - proc["PlannedDelivery"]).dt.days
-        proc["DelayDays"] = proc["DelayDays"].fillna(0).astype(float)
+        deltas = tbl.column("ActualDelivery").to_numpy() - tbl.column("PlannedDelivery").to_numpy()
+        # NaT (missing delivery dates) → NaN → 0, matching the old fillna(0)
+        delay_days = np.nan_to_num(deltas / np.timedelta64(1, "D"))
 
         # Build a rough triangular-ish PERT from observed delays:
         # low = 0; mode ≈ mean delay (at least 1 if we have delays); high ≈ max delay (at least 2)
         pd_low = 0.0
-        pd_ml = float(max(1.0, proc["DelayDays"].mean())) if len(proc) else 1.0
-        pd_high = float(max(2.0, proc["DelayDays"].max())) if len(proc) else 15.0
+        pd_ml = float(max(1.0, delay_days.mean())) if delay_days.size else 1.0
+        pd_high = float(max(2.0, delay_days.max())) if delay_days.size else 15.0
     else:
         # Fallback defaults if no procurement file
-        proc = pd.DataFrame()
         pd_low, pd_ml, pd_high = 0.0, 5.0, 15.0
 
-    results = []
-
-    # ---- 4) Simulate per project ----
-    for proj in base["ProjectID"].unique():
-        # Baselines
-        eb = base.loc[base["ProjectID"] == proj, "EAC_base"].mean()
-        bac = base.loc[base["ProjectID"] == proj, "BAC"].mean()
-        if pd.isna(eb) or eb == 0:
-            eb = bac  # if EAC not computed yet, use BAC as a baseline proxy
-
-        # Copy risks (you might filter by WBS/project here in a real system)
-        rc = risks.copy()
-        n = len(rc)
-
-        # Probability gates (True/False per iter × risk)
-        prob = rc["Probability"].values
-        gates = rng.random((iters, n)) <= prob
-
-        # Sample cost and schedule-day impacts per risk (iters × n_risks)
-        cost = pert(rc["CostLow"], rc["CostML"], rc["CostHigh"], (iters, n), rng)
-        days = pert(rc["SchedDaysLow"], rc["SchedDaysML"], rc["SchedDaysHigh"], (iters, n), rng)
-
-        # Sum impacts across risks per iteration
-        cost_imp = (cost * gates).sum(axis=1)  # shape: (iters,)
-        days_imp = (days * gates).sum(axis=1)  # shape: (iters,)
-
-        # Sample procurement delay per iteration (shape: (iters,))
-        pdays = pert(pd_low, pd_ml, pd_high, iters, rng)
-
-        # Convert days to dollars via a simple rate (configurable in a full system)
-        DAY_TO_DOLLARS = 15000.0
-        eac_delta_from_days = (days_imp + pdays) * DAY_TO_DOLLARS
-
-        # EAC distribution per iteration
-        EAC = eb + cost_imp + eac_delta_from_days
-
-        # Finish-days-over-baseline per iteration (toy proxy)
-        finish_days = days_imp + pdays
-
-        df = pd.DataFrame({"ProjectID": proj, "EAC": EAC, "FinishDaysOverBaseline": finish_days})
-        results.append(df)
-
-    # All-iteration runs
-    runs = pd.concat(results, ignore_index=True)
-
-    # ---- 5) Summaries & S-curves ----
-    def pct(s, p):
-        return float(np.percentile(s, p))
-
-    summary = (
-        runs.groupby("ProjectID", as_index=False)
-        .agg(
-            EAC_P10=("EAC", lambda s: pct(s, 10)),
-            EAC_P50=("EAC", lambda s: pct(s, 50)),
-            EAC_P80=("EAC", lambda s: pct(s, 80)),
-            Finish_P10=("FinishDaysOverBaseline", lambda s: pct(s, 10)),
-            Finish_P50=("FinishDaysOverBaseline", lambda s: pct(s, 50)),
-            Finish_P80=("FinishDaysOverBaseline", lambda s: pct(s, 80)),
+    # ---- 4) Simulate all projects in one broadcast ----
+    # The risk register applies identically to every project (a real system might
+    # filter by WBS/project here), so a single (iters x n_risks) draw covers the
+    # whole portfolio — no per-project Python loop or per-project RNG calls.
+    projects = base["ProjectID"].to_numpy()
+
+    # Baselines per project; if EAC not computed yet, use BAC as a baseline proxy
+    eac_base = base["EAC_base"].to_numpy(dtype=float)
+    bacs = base["BAC"].to_numpy(dtype=float)
+    eb = np.where(np.isnan(eac_base) | (eac_base == 0), bacs, eac_base)
+
+    # Dispatch the iteration chunks on a thread pool: each chunk's gate/PERT
+    # block is pure NumPy (GIL released), so draws overlap across cores while
+    # the spawned streams keep the combined result deterministic per seed.
+    # Materialize the coerced register as one contiguous (n_risks, 7) float64
+    # block and slice columns positionally: the sampling chunks then touch
+    # plain ndarrays only, with no pandas indexer in the hot path.
+    risk_arr = np.ascontiguousarray(risks[num_cols].to_numpy(dtype=np.float64))
+    prob = risk_arr[:, 0].astype(np.float32)  # compared against float32 uniforms
+    cost_params = (risk_arr[:, 1], risk_arr[:, 2], risk_arr[:, 3])  # CostLow/ML/High
+    days_params = (risk_arr[:, 4], risk_arr[:, 5], risk_arr[:, 6])  # SchedDaysLow/ML/High
+    proc_params = (pd_low, pd_ml, pd_high)
+    with ThreadPoolExecutor(max_workers=min(n_chunks, os.cpu_count() or 1)) as pool:
+        parts = list(
+            pool.map(
+                lambda rc: _sample_impacts(rc[0], rc[1], prob, cost_params, days_params, proc_params),
+                zip(rngs, chunk_sizes),
+            )
         )
-        .reset_index(drop=True)
+    cost_imp = np.concatenate([p[0] for p in parts])  # shape: (iters,)
+    days_imp = np.concatenate([p[1] for p in parts])  # shape: (iters,)
+    pdays = np.concatenate([p[2] for p in parts])  # shape: (iters,)
+
+    # Convert days to dollars via a simple rate (configurable in a full system)
+    DAY_TO_DOLLARS = 15000.0
+    eac_delta_from_days = (days_imp + pdays) * DAY_TO_DOLLARS
+
+    # Finish-days-over-baseline per iteration (toy proxy)
+    finish_days = days_imp + pdays
+
+    # EAC distribution: broadcast per-project baselines against per-iteration deltas
+    EAC = _combine_eac(eb, cost_imp + eac_delta_from_days)  # shape: (P, iters)
+
+    # All-iteration runs (project-major, matching the old per-project concat order)
+    runs = pd.DataFrame(
+        {
+            # Categorical: dictionary-encodes the heavily repeated IDs in the
+            # frame and the runs parquet instead of materialising P*iters strings
+            "ProjectID": pd.Categorical(np.repeat(projects, iters)),
+            "EAC": EAC.reshape(-1),
+            "FinishDaysOverBaseline": np.tile(finish_days, len(projects)),
+        }
     )
 
-    # EAC CDF points for S-curve plots (Power BI / Streamlit)
-    sc_rows = []
-    for proj, grp in runs.groupby("ProjectID"):
-        xs = np.linspace(grp["EAC"].min(), grp["EAC"].max(), 100)
-        eac_vals = grp["EAC"].to_numpy()
-        for x in xs:
-            sc_rows.append(
-                {
-                    "ProjectID": proj,
-                    "Metric": "EAC",
-                    "Value": float(x),
-                    "CDF": float((eac_vals <= x).mean()),
-                }
-            )
-    s_curve = pd.DataFrame(sc_rows)
+    # ---- 5) Summaries & S-curves ----
+    # One sort per project serves BOTH outputs: the percentile summary is
+    # interpolated straight off the sorted EAC array the S-curve needs anyway,
+    # so the separate groupby-quantile pass (its own partition per group) goes.
+    quantiles = np.array([0.10, 0.50, 0.80])
+    summary_cols = ["ProjectID", "EAC_P10", "EAC_P50", "EAC_P80", "Finish_P10", "Finish_P50", "Finish_P80"]
+
+    if iters == 0:
+        # Degenerate run (`--iters 0` is accepted by the CLI): there is nothing
+        # to interpolate quantiles from, so write schema-complete empty frames
+        # instead of letting the empty-array indexing below blow up.
+        summary = pd.DataFrame(columns=summary_cols)
+        s_curve = pd.DataFrame(columns=["ProjectID", "Metric", "Value", "CDF"])
+    else:
+        # Finish days are identical across projects by construction (np.tile
+        # above), so those three percentiles come from a single sort.
+        fin_q = _sorted_quantiles(np.sort(finish_days), quantiles)
+
+        # EAC CDF points for S-curve plots (Power BI / Streamlit): sort each
+        # project's EAC once, then searchsorted gives all 100 CDF points in one
+        # vectorized call instead of 100 full-array scans per project.
+        sc_frames = []
+        summary_rows = []
+        for proj, grp in runs.groupby("ProjectID", observed=True):
+            s = np.sort(grp["EAC"].to_numpy())
+            eac_q = _sorted_quantiles(s, quantiles)
+            summary_rows.append((proj, eac_q[0], eac_q[1], eac_q[2], fin_q[0], fin_q[1], fin_q[2]))
+            xs = np.linspace(s[0], s[-1], 100)
+            cdf = np.searchsorted(s, xs, side="right") / len(s)
+            sc_frames.append(pd.DataFrame({"ProjectID": proj, "Metric": "EAC", "Value": xs, "CDF": cdf}))
+        summary = pd.DataFrame(summary_rows, columns=summary_cols)
+        # Rows come out sorted by (ProjectID, Metric, Value): groupby walks the
+        # projects in key order and each xs grid is ascending. Consumers (the
+        # dashboard's S-curve plot) rely on this write-time ordering and skip
+        # their own sort.
+        s_curve = pd.concat(sc_frames, ignore_index=True)
 
     # ---- Write outputs ----
-    (outdir / "monte_carlo_runs.parquet").write_bytes(runs.to_parquet(index=False) or b"")
-    (outdir / "monte_carlo_summary.parquet").write_bytes(summary.to_parquet(index=False) or b"")
-    (outdir / "forecast_s_curves.parquet").write_bytes(s_curve.to_parquet(index=False) or b"")
+    # Write straight to the target paths; the old write_bytes(to_parquet(...))
+    # form materialized each file as an in-memory bytes object first.
+    runs.to_parquet(outdir / "monte_carlo_runs.parquet", index=False, **_PARQUET_KWARGS)
+    summary.to_parquet(outdir / "monte_carlo_summary.parquet", index=False, **_PARQUET_KWARGS)
+    s_curve.to_parquet(outdir / "forecast_s_curves.parquet", index=False, **_PARQUET_KWARGS)
 
     print(f"[monte_carlo] Wrote outputs in {outdir}")
 
@@ -6,10 +6,15 @@ import pandas as pd
 
 def main(samples_dir: Path, processed_dir: Path):
     schedule_fp = samples_dir / "schedule_activities.csv"
-    df = pd.read_csv(schedule_fp, parse_dates=["BaselineStart", "BaselineFinish", "Start", "Finish"])
+    # pyarrow engine: multithreaded parse + native timestamp conversion
+    df = pd.read_csv(schedule_fp, parse_dates=["BaselineStart", "BaselineFinish", "Start", "Finish"], engine="pyarrow")
+    # Dictionary-encode repeated ID strings; parquet keeps the dtype downstream
+    for col in ("ProjectID", "WBS", "Vendor"):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
     processed_dir.mkdir(parents=True, exist_ok=True)
     out = processed_dir / "schedule.parquet"
-    df.to_parquet(out, index=False)
+    df.to_parquet(out, index=False, engine="pyarrow", compression="zstd", compression_level=3)
     print(f"[p6_ingest] Wrote {out} rows={len(df)}")
 
 
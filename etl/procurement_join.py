@@ -1,16 +1,37 @@
 import argparse
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 
 def main(samples_dir: Path, processed_dir: Path):
-    df = pd.read_csv(Path(samples_dir) / "procurement.csv", parse_dates=["PlannedDelivery", "ActualDelivery"])
-    df["DelayDays"] = (df["ActualDelivery"] - df["PlannedDelivery"]).dt.days.fillna(0).astype(int)
-    df["DelayCost"] = df["DelayDays"].clip(lower=0) * (df["Qty"] * df["UnitCost"] * 0.001)
-    impacts = df.groupby(["WBS", "Vendor"], as_index=False).agg({"DelayDays": "sum", "DelayCost": "sum"})
+    df = pd.read_csv(
+        Path(samples_dir) / "procurement.csv",
+        parse_dates=["PlannedDelivery", "ActualDelivery"],
+        engine="pyarrow",
+    )
+    # The pyarrow engine leaves a date column with blanks as object dtype
+    # (strings + None) rather than datetime64/NaT — coerce so undelivered
+    # POs become NaT instead of crashing the delay arithmetic below
+    for col in ("PlannedDelivery", "ActualDelivery"):
+        if df[col].dtype == object:
+            df[col] = pd.to_datetime(df[col], errors="coerce")
+    # Dictionary-encode repeated ID strings so the groupby hashes int codes
+    for col in ("ProjectID", "WBS", "Vendor"):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    # Delay/cost math on raw NumPy arrays: one fused pass per column instead of
+    # the chained .dt.days.fillna().astype() Series intermediates (NaT → 0 days)
+    delta = df["ActualDelivery"].to_numpy() - df["PlannedDelivery"].to_numpy()
+    delay_days = np.nan_to_num(delta / np.timedelta64(1, "D")).astype("int64")
+    df["DelayDays"] = delay_days
+    qty = df["Qty"].to_numpy(dtype="float64")
+    unit_cost = df["UnitCost"].to_numpy(dtype="float64")
+    df["DelayCost"] = np.maximum(delay_days, 0) * (qty * unit_cost * 0.001)
+    impacts = df.groupby(["WBS", "Vendor"], as_index=False, observed=True).agg({"DelayDays": "sum", "DelayCost": "sum"})
     out_fp = Path(processed_dir) / "procurement_impacts.parquet"
-    impacts.to_parquet(out_fp, index=False)
+    impacts.to_parquet(out_fp, index=False, engine="pyarrow", compression="zstd", compression_level=3)
     print(f"[procurement_join] Wrote {out_fp} rows={len(impacts)}")
 
 
@@ -6,11 +6,18 @@ from pathlib import Path
 import pandas as pd
 
 
-def generate_stub(project_id: str, evm_path: Path, mc_path: Path):
-    evm = pd.read_parquet(evm_path)
-    mc = pd.read_parquet(mc_path)
-    last = evm[evm["ProjectID"] == project_id].sort_values("Period").tail(1).iloc[0].to_dict()
-    summ = mc[mc["ProjectID"] == project_id].iloc[0].to_dict()
+def _index_inputs(evm: pd.DataFrame, mc: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Sort once and index both tables by ProjectID so per-project lookups are O(log N)."""
+    evm_idx = evm.sort_values("Period").set_index("ProjectID")
+    mc_idx = mc.set_index("ProjectID")
+    return evm_idx, mc_idx
+
+
+def _narrative(project_id: str, evm_idx: pd.DataFrame, mc_idx: pd.DataFrame) -> dict:
+    """Build one narrative dict from pre-indexed EVM/MC tables."""
+    # evm_idx is already Period-sorted, so the last row per project is the latest
+    last = evm_idx.loc[[project_id]].iloc[-1].to_dict()
+    summ = mc_idx.loc[[project_id]].iloc[0].to_dict()
     return {
         "level": "project",
         "id": project_id,
@@ -37,6 +44,28 @@ def generate_stub(project_id: str, evm_path: Path, mc_path: Path):
     }
 
 
+def generate_stub(project_id: str, evm_path: Path, mc_path: Path):
+    evm = pd.read_parquet(evm_path)
+    mc = pd.read_parquet(mc_path)
+    evm_idx, mc_idx = _index_inputs(evm, mc)
+    return _narrative(project_id, evm_idx, mc_idx)
+
+
+def generate_all(processed_dir: Path) -> list[dict]:
+    """Build narratives for every project in the MC summary from one read/index pass."""
+    evm = pd.read_parquet(processed_dir / "evm_timeseries.parquet")
+    mc = pd.read_parquet(processed_dir / "monte_carlo_summary.parquet")
+    evm_idx, mc_idx = _index_inputs(evm, mc)
+    return [_narrative(project_id, evm_idx, mc_idx) for project_id in mc_idx.index.unique()]
+
+
+def _append_cost_log(processed_dir: Path, calls: int = 1) -> None:
+    # cost log stub
+    with open(processed_dir / "llm_cost_log.csv", "a", encoding="utf-8") as f:
+        ts = time.strftime("%Y-%m-%d %H:%M:%S")
+        f.write(f"{ts},stub,none,{calls},0,0\n")
+
+
 def main(project_id: str, processed_dir: Path):
     evm_fp = processed_dir / "evm_timeseries.parquet"
     mc_fp = processed_dir / "monte_carlo_summary.parquet"
@@ -44,16 +73,27 @@ def main(project_id: str, processed_dir: Path):
     n = generate_stub(project_id, evm_fp, mc_fp)
     with open(out_jsonl, "a", encoding="utf-8") as f:
         f.write(json.dumps(n) + "\n")
-    # cost log stub
-    with open(processed_dir / "llm_cost_log.csv", "a", encoding="utf-8") as f:
-        ts = time.strftime("%Y-%m-%d %H:%M:%S")
-        f.write(f"{ts},stub,none,0,0,0\n")
+    _append_cost_log(processed_dir)
     print(f"[ai_variance_narratives] Appended narrative to {out_jsonl}")
 
 
+def main_batch(processed_dir: Path):
+    """Batch variant of main(): one read pass, one JSONL append for all projects."""
+    out_jsonl = processed_dir / "variance_narratives.jsonl"
+    narratives = generate_all(processed_dir)
+    with open(out_jsonl, "a", encoding="utf-8") as f:
+        f.write("".join(json.dumps(n) + "\n" for n in narratives))
+    _append_cost_log(processed_dir, calls=len(narratives))
+    print(f"[ai_variance_narratives] Appended {len(narratives)} narratives to {out_jsonl}")
+
+
 if __name__ == "__main__":
     ap = argparse.ArgumentParser()
     ap.add_argument("--project_id", default="DEMO")
     ap.add_argument("--processed", default="data/processed")
+    ap.add_argument("--all", action="store_true", help="Generate narratives for every project in one pass")
     args = ap.parse_args()
-    main(args.project_id, Path(args.processed))
+    if args.all:
+        main_batch(Path(args.processed))
+    else:
+        main(args.project_id, Path(args.processed))
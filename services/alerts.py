@@ -5,98 +5,91 @@ Alert generation service.
 - Loads EVM KPIs and Monte Carlo summary from parquet files.
 - Emits breach alerts when KPI thresholds are violated.
 - Always emits one Monte Carlo summary alert per project and NEVER includes a 'trigger' key on summaries.
-- Writes a JSON list to data/processed/alerts_outbox.json.
+- Writes a JSON list to data/processed/alerts_outbox.json (latest run) and
+  appends each alert to data/processed/alerts_outbox.jsonl (running history).
 """
 
 import argparse
+import functools
 import json
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import yaml
 
+try:
+    # LibYAML parser (~5x faster); falls back to the pure-Python loader
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlSafeLoader
+
+try:
+    # C-implemented JSON encoder (~5x faster than stdlib); optional
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
 
 # ----------------------------
 # Utilities
 # ----------------------------
-def _safe_float(x: Any) -> float | None:
-    """Best-effort float coercion for JSON serialization; returns None if not coercible."""
-    try:
-        return float(x)
-    except Exception:
-        return None
+def _dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _read_parquet_cols(fp: Path, wanted: List[str]) -> pd.DataFrame:
+    """
+    Read only the `wanted` columns from a parquet file (skipping the rest of
+    the row groups entirely). Columns absent from the file are ignored, since
+    upstream outputs carry varying schemas (e.g. legacy 'P80_EAC').
+    """
+    names = set(pq.read_schema(fp).names)
+    # memory_map lets the OS page cache back the raw bytes (no read() copy);
+    # pre_buffer coalesces the projected column chunks into one I/O pass.
+    table = pq.read_table(fp, columns=[c for c in wanted if c in names], memory_map=True, pre_buffer=True)
+    return table.to_pandas()
 
 
-def _first_of(d: Dict[str, Any], candidates: List[str]) -> Any:
+def _float_or_none(v: Any) -> float | None:
     """
-    Return the first non-None value for the provided keys from a mapping.
+    NaN/None → None for JSON serialization. Assumes numeric input: the KPI
+    columns are coerced once per frame with pd.to_numeric in build_alerts, so
+    no per-value try/except is needed here.
     """
-    for k in candidates:
-        if k in d and d[k] is not None:
-            return d[k]
-    return None
+    return None if v is None or v != v else float(v)  # NaN != NaN
 
 
 # ----------------------------
 # Config loading
 # ----------------------------
+@functools.lru_cache(maxsize=8)
+def _load_cfg_cached(fp: str, mtime_ns: int) -> dict:
+    """Parse the YAML once per (path, mtime); repeat calls hit the cache."""
+    with open(fp, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlSafeLoader) or {}
+
+
 def load_cfg(fp: str) -> dict:
     """Load YAML config; return empty dict if the file is empty or missing keys."""
-    with open(fp, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    return _load_cfg_cached(fp, os.stat(fp).st_mtime_ns)
 
 
 # ----------------------------
 # Alert builders
 # ----------------------------
-def _build_breach_alert(row: pd.Series, proj_id: str, wbs: str, triggers: List[str]) -> Dict:
-    """
-    Build an alert for KPI breaches. Breach alerts DO carry a 'trigger'.
-    """
-    return {
-        "ts": datetime.utcnow().isoformat(),
-        "project_id": proj_id,
-        "wbs": wbs,
-        "trigger": "|".join(triggers),  # present only on breach alerts
-        "kpis": {
-            "CPI": _safe_float(row.get("CPI")),
-            "SPI": _safe_float(row.get("SPI")),
-            "EAC": _safe_float(row.get("EAC")),
-            "VAC": _safe_float(row.get("VAC")),
-            "BAC": _safe_float(row.get("BAC")),
-        },
-        "narrative": f"EVM thresholds breached for {proj_id}/{wbs}",
-        "recommendations": ["Escalate to PM", "Review critical path", "Accelerate POs"],
-    }
-
-
-def _build_summary_alert(proj_id: str, mc_row: Dict[str, Any]) -> Dict:
-    """
-    Build a Monte Carlo summary alert. NEVER include 'trigger' here.
-    Normalize KPI names (prefer 'EAC_P80', but accept legacy 'P80_EAC' seamlessly).
-    Always include Finish_P50 and Finish_P80 keys (may be None).
-    """
-    eac_p50 = _first_of(mc_row, ["EAC_P50"])
-    eac_p80 = _first_of(mc_row, ["EAC_P80", "P80_EAC"])
-    finish_p50 = _first_of(mc_row, ["Finish_P50"])
-    finish_p80 = _first_of(mc_row, ["Finish_P80"])
-
-    return {
-        "ts": datetime.utcnow().isoformat(),
-        "project_id": str(proj_id),  # <- use group key, not the row dict (which lacks ProjectID)
-        "wbs": None,
-        # no 'trigger'
-        "kpis": {
-            "EAC_P50": _safe_float(eac_p50),
-            "EAC_P80": _safe_float(eac_p80),
-            "Finish_P50": _safe_float(finish_p50),
-            "Finish_P80": _safe_float(finish_p80),
-        },
-        "narrative": "Monte Carlo summary for executive view",
-        "recommendations": ["Review contingency"],
-    }
+# Fixed recommendation lists, built once at import. Alerts are write-only
+# (serialized straight to the outbox), so sharing the same list object across
+# alerts is safe and avoids one list allocation per alert.
+_BREACH_RECS = ["Escalate to PM", "Review critical path", "Accelerate POs"]
+_SUMMARY_RECS = ["Review contingency"]
 
 
 def build_alerts(evm: pd.DataFrame, mc: pd.DataFrame, cfg: dict) -> List[Dict]:
@@ -110,30 +103,105 @@ def build_alerts(evm: pd.DataFrame, mc: pd.DataFrame, cfg: dict) -> List[Dict]:
     cpi_red = th.get("cpi_red", 0.9)
     spi_red = th.get("spi_red", 0.85)
 
+    # Trigger labels are constants for a given config; format them once here
+    # rather than inside the mask-to-string pass.
+    cpi_label = f"CPI<{cpi_red:.2f}"
+    spi_label = f"SPI<{spi_red:.2f}"
+    vac_label = "VAC<0"
+
+    # One batch timestamp shared by every alert in this run (and one datetime
+    # allocation/format total instead of one per alert).
+    ts = datetime.utcnow().isoformat()
+
     alerts: List[Dict] = []
+    if evm.empty and mc.empty:
+        return alerts
 
     # --- BREACH DETECTION (latest EVM row per ProjectID/WBS) ---
-    for (proj_id, wbs), grp in evm.groupby(["ProjectID", "WBS"]):
-        row = grp.sort_values("Period").tail(1).iloc[0]
-        triggers: List[str] = []
+    # Skipped outright for empty frames: even an empty sort/dedup pays the
+    # pandas setup cost.
+    if not evm.empty:
+        # One global sort + drop_duplicates instead of a per-group sort/tail loop.
+        # Sorting on the full key makes the "latest" pick deterministic for tied Periods.
+        latest = evm.sort_values(["ProjectID", "WBS", "Period"]).drop_duplicates(["ProjectID", "WBS"], keep="last")
+
+        # Coerce KPI columns once at C level; _float_or_none can then assume
+        # numeric cells instead of wrapping every value in try/except.
+        kpi_cols = [c for c in ("CPI", "SPI", "EAC", "VAC", "BAC") if c in latest.columns]
+        latest[kpi_cols] = latest[kpi_cols].apply(pd.to_numeric, errors="coerce")
 
-        cpi = row.get("CPI")
-        spi = row.get("SPI")
-        vac = row.get("VAC")
+        # Boolean masks per trigger; NaN comparisons are False, matching the old
+        # pd.notna guards. Missing KPI columns simply never trigger.
+        no_trigger = pd.Series(False, index=latest.index)
+        cpi_mask = (latest["CPI"] < cpi_red) if "CPI" in latest.columns else no_trigger
+        spi_mask = (latest["SPI"] < spi_red) if "SPI" in latest.columns else no_trigger
+        vac_mask = (latest["VAC"] < 0) if "VAC" in latest.columns else no_trigger
 
-        if pd.notna(cpi) and cpi < cpi_red:
-            triggers.append(f"CPI<{cpi_red:.2f}")
-        if pd.notna(spi) and spi < spi_red:
-            triggers.append(f"SPI<{spi_red:.2f}")
-        if pd.notna(vac) and vac < 0:
-            triggers.append("VAC<0")
+        trig = (
+            pd.Series(np.where(cpi_mask, cpi_label + "|", ""), index=latest.index)
+            + np.where(spi_mask, spi_label + "|", "")
+            + np.where(vac_mask, vac_label + "|", "")
+        ).str.rstrip("|")
 
-        if triggers:
-            alerts.append(_build_breach_alert(row, proj_id, wbs, triggers))
+        # Inline dict construction from positional tuples: no record-dict
+        # rebuild and no per-key .get() dispatch. The reindex pins the column
+        # order (absent KPIs become NaN → None). Breach alerts DO carry a
+        # 'trigger'.
+        breached = latest.loc[trig != ""].reindex(columns=["ProjectID", "WBS", "CPI", "SPI", "EAC", "VAC", "BAC"])
+        for (pid, wbs, cpi, spi, eac, vac, bac), triggers in zip(
+            breached.itertuples(index=False, name=None), trig.loc[trig != ""]
+        ):
+            alerts.append(
+                {
+                    "ts": ts,
+                    "project_id": pid,
+                    "wbs": wbs,
+                    "trigger": triggers,  # present only on breach alerts
+                    "kpis": {
+                        "CPI": _float_or_none(cpi),
+                        "SPI": _float_or_none(spi),
+                        "EAC": _float_or_none(eac),
+                        "VAC": _float_or_none(vac),
+                        "BAC": _float_or_none(bac),
+                    },
+                    "narrative": f"EVM thresholds breached for {pid}/{wbs}",
+                    "recommendations": _BREACH_RECS,
+                }
+            )
 
     # --- MC SUMMARY (first row per ProjectID) ---
-    for proj_id, mc_row in mc.groupby("ProjectID").first().iterrows():
-        alerts.append(_build_summary_alert(str(proj_id), dict(mc_row)))
+    # Normalize columns once (legacy 'P80_EAC' → 'EAC_P80', guarantee the
+    # Finish percentile keys), then emit plain records — no per-cell iterrows
+    # boxing. Absent columns reindex to NaN, which _float_or_none maps to None.
+    # drop_duplicates is a single hash pass over the key column — no per-column
+    # aggregator dispatch like groupby().first().
+    if not mc.empty:
+        mc_first = mc.drop_duplicates(subset=["ProjectID"], keep="first")
+        if "EAC_P80" not in mc_first.columns and "P80_EAC" in mc_first.columns:
+            mc_first = mc_first.rename(columns={"P80_EAC": "EAC_P80"})
+        mc_first = mc_first.reindex(columns=["ProjectID", "EAC_P50", "EAC_P80", "Finish_P50", "Finish_P80"])
+        mc_kpi = ["EAC_P50", "EAC_P80", "Finish_P50", "Finish_P80"]
+        mc_first[mc_kpi] = mc_first[mc_kpi].apply(pd.to_numeric, errors="coerce")
+        # itertuples yields plain tuples (no per-cell Series boxing, no dict
+        # rebuild); column order is fixed by the reindex above. Summary alerts
+        # NEVER carry a 'trigger' key.
+        for pid, eac50, eac80, fin50, fin80 in mc_first.itertuples(index=False, name=None):
+            alerts.append(
+                {
+                    "ts": ts,
+                    "project_id": str(pid),
+                    "wbs": None,
+                    # no 'trigger'
+                    "kpis": {
+                        "EAC_P50": _float_or_none(eac50),
+                        "EAC_P80": _float_or_none(eac80),
+                        "Finish_P50": _float_or_none(fin50),
+                        "Finish_P80": _float_or_none(fin80),
+                    },
+                    "narrative": "Monte Carlo summary for executive view",
+                    "recommendations": _SUMMARY_RECS,
+                }
+            )
 
     return alerts
 
@@ -141,20 +209,87 @@ def build_alerts(evm: pd.DataFrame, mc: pd.DataFrame, cfg: dict) -> List[Dict]:
 # ----------------------------
 # Main entrypoint
 # ----------------------------
-def main(cfg_fp: str, processed_dir: str, dry_run: bool = True) -> None:
+def main(
+    cfg_fp: Optional[str],
+    processed_dir: str,
+    dry_run: bool = True,
+    *,
+    config_obj: Optional[Dict] = None,
+) -> None:
     """
     Read parquet inputs, build alerts, and write JSON outbox.
+
+    Callers that already hold the parsed config (tests, embedding apps) can
+    pass it as ``config_obj`` and skip the YAML file read entirely; ``cfg_fp``
+    is ignored (and may be None) in that case.
     """
-    cfg = load_cfg(cfg_fp)
+    if config_obj is not None:
+        cfg = config_obj
+    else:
+        if cfg_fp is None:
+            raise ValueError("cfg_fp is required when config_obj is not provided")
+        cfg = load_cfg(cfg_fp)
     processed = Path(processed_dir)
 
-    evm = pd.read_parquet(processed / "evm_timeseries.parquet")
-    mc = pd.read_parquet(processed / "monte_carlo_summary.parquet")
+    # Project to the columns the alert logic actually touches; the EVM
+    # timeseries carries EV/PV/AC/CV/SV etc. that never reach an alert.
+    evm = _read_parquet_cols(
+        processed / "evm_timeseries.parquet",
+        ["ProjectID", "WBS", "Period", "CPI", "SPI", "EAC", "VAC", "BAC"],
+    )
+    mc = _read_parquet_cols(
+        processed / "monte_carlo_summary.parquet",
+        ["ProjectID", "EAC_P50", "EAC_P80", "P80_EAC", "Finish_P50", "Finish_P80"],
+    )
+
+    # Dictionary-encode the repeated ID strings: the latest-row sort/dedup and
+    # the MC dedup then work on int codes instead of hashing Python strings
+    # (indexing a categorical still yields the string label downstream).
+    for c in ("ProjectID", "WBS"):
+        if c in evm.columns:
+            evm[c] = evm[c].astype("category")
+    if "ProjectID" in mc.columns:
+        mc["ProjectID"] = mc["ProjectID"].astype("category")
+
+    # float32 is ample for alert thresholds/display and halves the bytes the
+    # breach masks move; non-numeric cells coerce to NaN (never trigger).
+    for c in ("CPI", "SPI", "EAC", "VAC", "BAC"):
+        if c in evm.columns:
+            evm[c] = pd.to_numeric(evm[c], errors="coerce", downcast="float")
 
     alerts = build_alerts(evm, mc, cfg)
 
+    # Compact JSON (no indent: half the bytes) via orjson when installed.
+    # The snapshot is always (re)written — even empty — so consumers never
+    # see a stale previous run.
     out_fp = processed / "alerts_outbox.json"
-    out_fp.write_text(json.dumps(alerts, ensure_ascii=False, indent=2), encoding="utf-8")
+    out_fp.write_bytes(_dumps_bytes(alerts))
+
+    if not alerts:
+        # Nothing to append or mirror; skip the history/parquet writers.
+        print(f"[alerts] Wrote 0 alerts to {out_fp}. dry_run={dry_run}")
+        return
+
+    # Append-only JSONL history: O(new alerts) per run, no re-reading or
+    # rewriting of previous runs (the .json above stays a latest-run snapshot).
+    # Each record is encoded and written individually, so peak memory stays
+    # one alert regardless of batch size and I/O overlaps with encoding.
+    hist_fp = processed / "alerts_outbox.jsonl"
+    with hist_fp.open("ab") as f:
+        for a in alerts:
+            f.write(_dumps_bytes(a))
+            f.write(b"\n")
+
+    # Columnar mirror for pandas/polars consumers: dictionary-encoded IDs,
+    # native nulls, and the column projection JSON can't offer.
+    flat = pd.json_normalize(alerts)
+    for c in ("project_id", "trigger"):
+        if c in flat.columns:
+            flat[c] = flat[c].astype("category")
+    flat.to_parquet(
+        processed / "alerts_outbox.parquet", index=False, engine="pyarrow", compression="zstd", compression_level=3
+    )
+
     print(f"[alerts] Wrote {len(alerts)} alerts to {out_fp}. dry_run={dry_run}")
 
 
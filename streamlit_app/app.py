@@ -22,65 +22,106 @@ HOW TO TEACH THIS
 from __future__ import annotations
 
 # ── Standard library
+import base64
+import contextlib
+import copy
+import functools
+import io
 import json
 import os
 import platform
+import shutil
 import subprocess  # nosec B404 - used via safe wrapper with shell=False
 import sys
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import IO, Any, Dict, List, Optional, Tuple, cast
 
 # ── Third-party
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
+import pyarrow.parquet as pq
 import streamlit as st
 import yaml
 
+try:
+    # C-implemented JSON parser (~3-5x faster than stdlib); optional
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
+try:
+    # LibYAML parser/emitter (~5-10x faster); falls back to pure Python
+    from yaml import CSafeDumper as _YamlSafeDumper
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeDumper as _YamlSafeDumper
+    from yaml import SafeLoader as _YamlSafeLoader
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 1) CONFIG LOADING — merge config.yaml with defaults so missing keys never crash
 # ──────────────────────────────────────────────────────────────────────────────
+_CONFIG_DEFAULTS: Dict[str, Any] = {
+    "thresholds": {
+        "cpi_red": 0.90,
+        "spi_red": 0.85,
+        "vac_negative": 0.0,
+        "p80_variance_cost_warn": 0.05,
+        "p80_variance_days_warn": 10,
+    },
+    "paths": {
+        "samples_dir": "data/samples",
+        "processed_dir": "data/processed",
+        "charts_dir": "charts",
+    },
+    "monte_carlo": {
+        "iterations": 5000,
+        "seed": 42,
+        "distribution": "PERT",
+        "default_procurement_delay_days": [0, 5, 15],
+        "sensitivity": ["spearman", "pearson"],
+    },
+    "ui": {"logo_path": "assets/itcmanagement_group.jpg", "theme": "dark"},
+    "scenario": {
+        "delay_cost_rate_per_day": 15000,
+        "spi_productivity_sensitivity": 0.5,
+        "cpi_resource_sensitivity": 0.4,
+    },
+    "ai": {"provider": "env:LLM_PROVIDER", "model": "env:LLM_MODEL", "temperature": 0.2, "max_tokens": 1200},
+    "alerts": {"slack_enabled": True, "email_enabled": True, "jira_enabled": True, "dry_run": True},
+}
+
+
+def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively overlay override onto base (nested dicts merge key-wise,
+    anything else replaces), so a user overriding one nested key keeps the
+    sibling defaults at every depth."""
+    for k, v in override.items():
+        if isinstance(v, dict) and isinstance(base.get(k), dict):
+            _deep_merge(base[k], v)
+        else:
+            base[k] = v
+    return base
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse + merge once per (path, mtime); Streamlit reruns hit the cache."""
+    cfg = copy.deepcopy(_CONFIG_DEFAULTS)
+    if mtime_ns >= 0:
+        with open(path_str, "r", encoding="utf-8") as f:
+            user_cfg = yaml.load(f, Loader=_YamlSafeLoader) or {}
+        _deep_merge(cfg, user_cfg)
+    return cfg
+
+
 def load_config(cfg_path: Path) -> Dict[str, Any]:
     """Return a config dict: defaults overlaid with user config.yaml if present."""
-    defaults: Dict[str, Any] = {
-        "thresholds": {
-            "cpi_red": 0.90,
-            "spi_red": 0.85,
-            "vac_negative": 0.0,
-            "p80_variance_cost_warn": 0.05,
-            "p80_variance_days_warn": 10,
-        },
-        "paths": {
-            "samples_dir": "data/samples",
-            "processed_dir": "data/processed",
-            "charts_dir": "charts",
-        },
-        "monte_carlo": {
-            "iterations": 5000,
-            "seed": 42,
-            "distribution": "PERT",
-            "default_procurement_delay_days": [0, 5, 15],
-            "sensitivity": ["spearman", "pearson"],
-        },
-        "ui": {"logo_path": "assets/itcmanagement_group.jpg", "theme": "dark"},
-        "scenario": {
-            "delay_cost_rate_per_day": 15000,
-            "spi_productivity_sensitivity": 0.5,
-            "cpi_resource_sensitivity": 0.4,
-        },
-        "ai": {"provider": "env:LLM_PROVIDER", "model": "env:LLM_MODEL", "temperature": 0.2, "max_tokens": 1200},
-        "alerts": {"slack_enabled": True, "email_enabled": True, "jira_enabled": True, "dry_run": True},
-    }
-
-    if cfg_path.exists():
-        with cfg_path.open("r", encoding="utf-8") as f:
-            user_cfg = yaml.safe_load(f) or {}
-        for k, v in user_cfg.items():
-            if isinstance(v, dict) and k in defaults and isinstance(defaults[k], dict):
-                defaults[k].update(v)  # shallow-merge dicts
-            else:
-                defaults[k] = v
-    return defaults
+    mtime_ns = cfg_path.stat().st_mtime_ns if cfg_path.exists() else -1
+    # deepcopy so callers (governance toggles) can mutate without poisoning the cache
+    return copy.deepcopy(_load_config_cached(str(cfg_path), mtime_ns))
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -112,15 +153,16 @@ st.set_page_config(
     layout="wide",
 )
 
-# Basic CSS for a clean executive look
-st.markdown(
-    """
+# Basic CSS for a clean executive look (static — compiled into the header once)
+_STATIC_CSS = """
 <style>
 .block-container { padding-top: 1rem; padding-bottom: 2rem; }
 .hero { background: linear-gradient(90deg, #0B1F3A 0%, #12345c 100%); border-radius: 14px;
-        padding: 18px 22px; color: #fff; margin-bottom: 10px; box-shadow: 0 6px 16px rgba(0,0,0,0.2); }
+        padding: 18px 22px; color: #fff; margin-bottom: 10px; box-shadow: 0 6px 16px rgba(0,0,0,0.2);
+        display: flex; align-items: center; }
 .hero h1 { font-size: 1.5rem; margin: 0; line-height: 1.2; }
 .hero p  { margin: 0.2rem 0 0; opacity: 0.9; }
+.hero img { height: 64px; border-radius: 8px; margin-right: 18px; }
 .kpi-card { border: 1px solid #e8e8e8; border-radius: 12px; padding: 12px 14px; background: #fff;
            box-shadow: 0 2px 8px rgba(0,0,0,0.06); }
 .kpi-label { font-size: 0.9rem; color: #666; }
@@ -130,47 +172,226 @@ st.markdown(
 .badge-green { background:#d1fae5; color:#065f46; }
 .badge-red { background:#fee2e2; color:#991b1b; }
 </style>
-""",
-    unsafe_allow_html=True,
-)
+"""
+
+
+@st.cache_resource
+def _build_header_html(logo_str: str) -> str:
+    """CSS + hero header as one pre-built string: a rerun emits a single
+    markdown delta instead of four (CSS, hero open, title, hero close)."""
+    img_html = ""
+    if logo_str:
+        b64 = base64.b64encode(Path(logo_str).read_bytes()).decode()
+        img_html = f'<img src="data:image/jpeg;base64,{b64}" alt="logo"/>'
+    return (
+        _STATIC_CSS + '<div class="hero">' + img_html + "<div><h1>Mega-EVM Master Control – What-If Copilot</h1>"
+        '<p class="small-caption">Built by James Lim @ ITC Management Group</p></div></div>'
+    )
+
 
 # Header with logo + product tag
-with st.container():
-    st.markdown('<div class="hero">', unsafe_allow_html=True)
-    cols = st.columns([1, 7], vertical_alignment="center")
-    with cols[0]:
-        if logo_path.exists():
-            # NOTE: Streamlit can render image paths directly; Pillow not required.
-            st.image(str(logo_path), use_container_width=False)
-    with cols[1]:
-        st.markdown(
-            """
-<h1>Mega-EVM Master Control – What-If Copilot</h1>
-<p class="small-caption">Built by James Lim @ ITC Management Group</p>
-""",
-            unsafe_allow_html=True,
-        )
-    st.markdown("</div>", unsafe_allow_html=True)
+st.markdown(_build_header_html(str(logo_path) if logo_path.exists() else ""), unsafe_allow_html=True)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 3) HELPERS — file I/O, subprocess, config persistence
 # ──────────────────────────────────────────────────────────────────────────────
+# Platform checks resolved once at import; every button press otherwise
+# re-dispatches through platform.system()
+_IS_WINDOWS = platform.system() == "Windows"
+_IS_DARWIN = platform.system() == "Darwin"
+
+# Columns each known file actually feeds into the tabs; everything else is
+# skipped at read time. Files not listed here load in full.
+_PARQUET_COLUMNS: Dict[str, List[str]] = {
+    "evm_timeseries.parquet": ["ProjectID", "WBS", "Period", "CPI", "SPI", "EAC", "VAC", "BAC"],
+    "monte_carlo_summary.parquet": ["ProjectID", "EAC_P50", "EAC_P80", "P80_EAC", "Finish_P50", "Finish_P80"],
+    "procurement_impacts.parquet": ["ProjectID", "WBS", "Vendor", "DelayDays", "DelayCost"],
+}
+
+
+@st.cache_data(show_spinner=False)
+def _load_parquet_cached(path_str: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parquet decode cached on (path, mtime, size); reruns become dict lookups.
+
+    Reads go through pyarrow directly: pre_buffer coalesces the column-chunk
+    I/O into one pass, use_threads decodes columns in parallel, and
+    self_destruct releases the Arrow buffers during the pandas conversion.
+    """
+    wanted = _PARQUET_COLUMNS.get(Path(path_str).name)
+    columns = None
+    if wanted is not None:
+        names = set(pq.read_schema(path_str).names)
+        columns = [c for c in wanted if c in names]
+    tbl = pq.read_table(path_str, columns=columns, pre_buffer=True, use_threads=True)
+    return tbl.to_pandas(self_destruct=True)
+
+
 def load_parquet(fp: Path) -> Optional[pd.DataFrame]:
-    """Safely read a parquet file; return None if missing/unreadable."""
+    """Safely read a parquet file; return None if missing/unreadable.
+
+    Cached across Streamlit reruns keyed on the file's path/mtime/size, so a
+    widget interaction re-decodes nothing unless ETL rewrote the file.
+    """
+    try:
+        if not fp.exists():
+            return None
+        info = fp.stat()
+        return _load_parquet_cached(str(fp), info.st_mtime_ns, info.st_size)
+    except Exception as e:
+        st.warning(f"Could not read {fp.name}: {e}")
+        return None
+
+
+@st.cache_data(show_spinner=False)
+def _load_runs_for_project(path_str: str, mtime_ns: int, size: int, project: Any) -> pd.DataFrame:
+    tbl = pq.read_table(
+        path_str,
+        columns=["ProjectID", "FinishDaysOverBaseline"],
+        filters=[("ProjectID", "=", project)],
+        pre_buffer=True,
+        use_threads=True,
+    )
+    return tbl.to_pandas(self_destruct=True)
+
+
+@st.cache_data(show_spinner=False)
+def _runs_hist_fig(path_str: str, mtime_ns: int, size: int, project: Any) -> Dict[str, Any]:
+    rproj = _load_runs_for_project(path_str, mtime_ns, size, project)
+    if not len(rproj):
+        return {}
+    # Bin server-side: the browser gets 30 bar heights instead of every raw
+    # run value to re-bin in JS.
+    counts, edges = np.histogram(rproj["FinishDaysOverBaseline"].to_numpy(), bins=30)
+    centers = (edges[:-1] + edges[1:]) / 2
+    fig = go.Figure(go.Bar(x=centers, y=counts))
+    fig.update_layout(
+        title=f"Finish Days over Baseline — Distribution — {project}",
+        xaxis_title="Days over baseline",
+        yaxis_title="count",
+        bargap=0,
+    )
+    return cast(Dict[str, Any], fig.to_dict())
+
+
+def runs_hist_fig(fp: Path, project: Any) -> Optional[Dict[str, Any]]:
+    """Histogram figure payload for the selected project's Monte Carlo runs.
+
+    The runs file is iterations x projects — by far the largest output — so
+    only the selected project's rows are read (predicate pushdown skips the
+    other row groups), and the finished figure dict is cached per file
+    version + project: flipping between projects swaps prebuilt payloads
+    with no Figure construction or re-binning. Returns None if the file is
+    missing/unreadable, {} if the project has no runs.
+    """
+    try:
+        if not fp.exists():
+            return None
+        info = fp.stat()
+        return cast(Dict[str, Any], _runs_hist_fig(str(fp), info.st_mtime_ns, info.st_size, project))
+    except Exception as e:
+        st.warning(f"Could not read {fp.name}: {e}")
+        return None
+
+
+@st.cache_data(show_spinner=False)
+def _load_scurve_for_project(path_str: str, mtime_ns: int, size: int, project: Any) -> pd.DataFrame:
+    tbl = pq.read_table(
+        path_str,
+        columns=["Value", "CDF"],
+        filters=[("ProjectID", "=", project), ("Metric", "=", "EAC")],
+        pre_buffer=True,
+        use_threads=True,
+    )
+    return tbl.to_pandas(self_destruct=True)
+
+
+@st.cache_data(show_spinner=False)
+def _scurve_fig(path_str: str, mtime_ns: int, size: int, project: Any) -> Dict[str, Any]:
+    sc_proj = _load_scurve_for_project(path_str, mtime_ns, size, project)
+    if not len(sc_proj):
+        return {}
+    # The ETL writes S-curve rows sorted by (ProjectID, Metric, Value), so the
+    # slice plots as-is — no per-render sort. Scattergl renders the line on
+    # WebGL instead of building one long SVG path.
+    fig = go.Figure(go.Scattergl(x=sc_proj["Value"], y=sc_proj["CDF"], mode="lines"))
+    fig.update_layout(
+        title=f"EAC S-curve (CDF) — {project}",
+        xaxis_title="EAC ($)",
+        yaxis_title="Cumulative Probability",
+        yaxis=dict(range=[0, 1]),
+    )
+    return cast(Dict[str, Any], fig.to_dict())
+
+
+def scurve_fig(fp: Path, project: Any) -> Optional[Dict[str, Any]]:
+    """S-curve figure payload for the selected project's EAC CDF.
+
+    Both predicates push down into the parquet scan, so non-matching row
+    groups never leave disk and only the two plotted columns are decoded;
+    the finished figure dict is cached per file version + project like the
+    runs histogram above. Returns None if the file is missing/unreadable,
+    {} if the project has no points.
+    """
     try:
-        return pd.read_parquet(fp) if fp.exists() else None
+        if not fp.exists():
+            return None
+        info = fp.stat()
+        return cast(Dict[str, Any], _scurve_fig(str(fp), info.st_mtime_ns, info.st_size, project))
     except Exception as e:
         st.warning(f"Could not read {fp.name}: {e}")
         return None
 
 
+@st.cache_data(show_spinner=False)
+def _parquet_num_rows(path_str: str, mtime_ns: int, size: int) -> int:
+    return int(pq.ParquetFile(path_str).metadata.num_rows)
+
+
+def parquet_num_rows(fp: Path) -> int:
+    """Row count straight from the parquet footer — no data pages read."""
+    try:
+        if not fp.exists():
+            return 0
+        info = fp.stat()
+        return int(_parquet_num_rows(str(fp), info.st_mtime_ns, info.st_size))
+    except Exception:
+        return 0
+
+
+@st.cache_data(show_spinner=False)
+def _load_text_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    return Path(path_str).read_text(encoding="utf-8")
+
+
 def load_text(fp: Path) -> Optional[str]:
-    """Read a text/JSON file into a string; return None if missing or unreadable."""
+    """Read a text/JSON file into a string; return None if missing or unreadable.
+
+    Cached the same way as load_parquet (path/mtime/size key).
+    """
     if not fp.exists():
         return None
     try:
-        return fp.read_text(encoding="utf-8")
+        info = fp.stat()
+        return cast(str, _load_text_cached(str(fp), info.st_mtime_ns, info.st_size))
+    except Exception as e:
+        st.warning(f"Could not read {fp.name}: {e}")
+        return None
+
+
+@st.cache_data(show_spinner=False)
+def _load_alerts_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    raw = Path(path_str).read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def load_alerts(fp: Path) -> Optional[Any]:
+    """Parse the alerts outbox JSON once per file version; reruns hit the cache."""
+    if not fp.exists():
+        return None
+    try:
+        info = fp.stat()
+        return _load_alerts_cached(str(fp), info.st_mtime_ns, info.st_size)
     except Exception as e:
         st.warning(f"Could not read {fp.name}: {e}")
         return None
@@ -181,8 +402,6 @@ def run_command(cmd: List[str] | str, cwd: Optional[Path] = None) -> Tuple[int,
     Run a command safely with shell=False across platforms.
     Returns (exit_code, stdout, stderr).
     """
-    is_windows = platform.system() == "Windows"
-
     # Normalize the input into a list[str]
     if isinstance(cmd, str):
         cmd_list: List[str] = [cmd]
@@ -190,7 +409,7 @@ def run_command(cmd: List[str] | str, cwd: Optional[Path] = None) -> Tuple[int,
         cmd_list = [str(x) for x in cmd]
 
     # If first token is a .bat/.cmd on Windows, wrap with cmd.exe /c (no shell=True)
-    if is_windows and cmd_list:
+    if _IS_WINDOWS and cmd_list:
         first = cmd_list[0].lower()
         if first.endswith(".bat") or first.endswith(".cmd"):
             cmd_list = ["cmd.exe", "/c"] + cmd_list
@@ -205,10 +424,48 @@ def run_command(cmd: List[str] | str, cwd: Optional[Path] = None) -> Tuple[int,
     return proc.returncode, proc.stdout, proc.stderr
 
 
+def run_command_streamed(
+    cmd: List[str] | str,
+    cwd: Optional[Path] = None,
+    on_line: Optional[Any] = None,
+    tail_lines: int = 200,
+) -> Tuple[int, str]:
+    """
+    Run a command with shell=False, streaming merged stdout/stderr line by
+    line to `on_line` (e.g. a live log placeholder). Only a rolling tail of
+    `tail_lines` lines is kept in memory, so long runs neither freeze the UI
+    behind a fully-buffered capture nor accumulate unbounded logs.
+    Returns (exit_code, tail_text).
+    """
+    cmd_list = [cmd] if isinstance(cmd, str) else [str(x) for x in cmd]
+    if _IS_WINDOWS and cmd_list:
+        first = cmd_list[0].lower()
+        if first.endswith(".bat") or first.endswith(".cmd"):
+            cmd_list = ["cmd.exe", "/c"] + cmd_list
+
+    proc = subprocess.Popen(  # nosec B603 - command is constructed, shell=False
+        cmd_list,
+        cwd=str(cwd) if cwd else None,
+        shell=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,  # line-buffered
+    )
+    tail: deque[str] = deque(maxlen=tail_lines)
+    stdout = cast(IO[str], proc.stdout)  # PIPE guarantees a stream
+    for line in stdout:
+        tail.append(line.rstrip("\n"))
+        if on_line is not None:
+            on_line("\n".join(tail))
+    stdout.close()
+    return proc.wait(), "\n".join(tail)
+
+
 def open_file_cross_platform(path: Path) -> Tuple[int, str, str]:
     """Open a file with the OS default app (e.g., .pbix → Power BI) in a safe way."""
     try:
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             comspec = os.environ.get("COMSPEC") or r"C:\Windows\System32\cmd.exe"
             p = path.resolve()
             if not p.exists():
@@ -224,7 +481,7 @@ def open_file_cross_platform(path: Path) -> Tuple[int, str, str]:
             )
             return result.returncode, "Opened via cmd start", result.stderr
 
-        if platform.system() == "Darwin":
+        if _IS_DARWIN:
             return run_command(["open", str(path)])
 
         return run_command(["xdg-open", str(path)])
@@ -233,9 +490,19 @@ def open_file_cross_platform(path: Path) -> Tuple[int, str, str]:
 
 
 def save_config(cfg: Dict[str, Any], path: Path) -> None:
-    """Persist the in-memory config back to config.yaml."""
-    with path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(cfg, f, sort_keys=False, indent=2)
+    """Persist the in-memory config back to config.yaml.
+
+    No-op when nothing changed, and an atomic tmp-file replace otherwise, so
+    a toggle that matches the on-disk state costs nothing and a real write
+    can never leave a half-written config behind.
+    """
+    new = yaml.dump(cfg, Dumper=_YamlSafeDumper, sort_keys=False, indent=2)
+    old = path.read_text(encoding="utf-8") if path.exists() else ""
+    if new == old:
+        return
+    tmp = path.with_suffix(".yaml.tmp")
+    tmp.write_text(new, encoding="utf-8")
+    os.replace(tmp, path)
 
 
 def set_cfg(path_keys: List[str], value: Any, cfg: Dict[str, Any]) -> Dict[str, Any]:
@@ -280,7 +547,11 @@ with st.sidebar:
         saved: List[str] = []
         for uf in uploaded:
             if uf.name.lower() in allowed:
-                (SAMPLES_DIR / uf.name).write_bytes(uf.getvalue())
+                # Stream to disk in 1 MiB chunks; getvalue() would hold the
+                # whole upload in memory a second time.
+                uf.seek(0)
+                with (SAMPLES_DIR / uf.name).open("wb") as dst:
+                    shutil.copyfileobj(uf, dst, length=1024 * 1024)
                 saved.append(uf.name)
         if saved:
             st.success(f"Saved to `{CFG['paths']['samples_dir']}/`: {', '.join(saved)}")
@@ -316,32 +587,33 @@ with st.sidebar:
     )
     seed = st.number_input("Random seed", min_value=0, value=int(CFG["monte_carlo"]["seed"]), step=1)
     if st.button("🎲 Run Monte Carlo", use_container_width=True):
-        with st.spinner("Running Monte Carlo…"):
-            python = sys.executable
-            cmd = [
-                python,
-                "-m",
-                "etl.monte_carlo",
-                "--iters",
-                str(iters),
-                "--seed",
-                str(seed),
-                "--processed",
-                str(PROCESSED_DIR),
-                "--samples",
-                str(SAMPLES_DIR),
-                "--outdir",
-                str(PROCESSED_DIR),
-            ]
-            code, out, err = run_command(cmd, cwd=ROOT)
-        if code == 0:
-            st.success("Monte Carlo completed. Press Ctrl+F5 to refresh charts.")
-        else:
-            st.error("Monte Carlo failed. See logs below.")
-        with st.expander("Show Monte Carlo output"):
-            st.code(out or "<no stdout>")
-            if err:
-                st.code(err)
+        python = sys.executable
+        cmd = [
+            python,
+            "-m",
+            "etl.monte_carlo",
+            "--iters",
+            str(iters),
+            "--seed",
+            str(seed),
+            "--processed",
+            str(PROCESSED_DIR),
+            "--samples",
+            str(SAMPLES_DIR),
+            "--outdir",
+            str(PROCESSED_DIR),
+        ]
+        # Streamed run: the status panel shows a live rolling log instead of
+        # blocking behind a fully-buffered capture_output call.
+        with st.status("Running Monte Carlo…", expanded=True) as mc_status:
+            log_box = st.empty()
+            code, log_tail = run_command_streamed(cmd, cwd=ROOT, on_line=lambda text: log_box.code(text))
+            if not log_tail:
+                log_box.code("<no output>")
+            if code == 0:
+                mc_status.update(label="Monte Carlo completed. Press Ctrl+F5 to refresh charts.", state="complete")
+            else:
+                mc_status.update(label="Monte Carlo failed. See log above.", state="error")
 
     # Open Power BI report (if present)
     st.divider()
@@ -413,9 +685,9 @@ with st.sidebar:
 evm_df = load_parquet(EVM_FP)
 mc_df = load_parquet(MC_SUM_FP)
 proc_df = load_parquet(PROC_FP)
-runs_df = load_parquet(RUNS_FP)
-scurve_df = load_parquet(SCURVE_FP)
-alerts_text = load_text(ALERTS_FP)
+# monte_carlo_runs.parquet and forecast_s_curves.parquet are loaded lazily
+# (and per-project) in the Forecast tab — the other tabs never touch them.
+alerts_obj = load_alerts(ALERTS_FP)
 
 with st.expander("Loaded data status", expanded=False):
     st.write(
@@ -423,9 +695,9 @@ with st.expander("Loaded data status", expanded=False):
             "evm_timeseries.parquet": 0 if evm_df is None else len(evm_df),
             "monte_carlo_summary.parquet": 0 if mc_df is None else len(mc_df),
             "procurement_impacts.parquet": 0 if proc_df is None else len(proc_df),
-            "monte_carlo_runs.parquet": 0 if runs_df is None else len(runs_df),
-            "forecast_s_curves.parquet": 0 if scurve_df is None else len(scurve_df),
-            "alerts_outbox.json": 0 if alerts_text is None else len(alerts_text),
+            "monte_carlo_runs.parquet": parquet_num_rows(RUNS_FP),
+            "forecast_s_curves.parquet": parquet_num_rows(SCURVE_FP),
+            "alerts_outbox.json": 0 if alerts_obj is None else len(alerts_obj),
         }
     )
 
@@ -438,64 +710,166 @@ evm_df = cast(pd.DataFrame, evm_df)
 mc_df = cast(pd.DataFrame, mc_df)
 proc_df = cast(pd.DataFrame, proc_df)
 
+# Dictionary-encode the key columns and downcast the KPI numerics: groupbys
+# hash int codes instead of Python strings, and float32 halves the bytes the
+# reductions move (ample precision for threshold checks and display).
+evm_df = evm_df.astype(
+    {
+        **{c: "category" for c in ("ProjectID", "WBS") if c in evm_df.columns},
+        **{c: "float32" for c in ("CPI", "SPI", "EAC", "VAC", "BAC") if c in evm_df.columns},
+    },
+    copy=False,
+)
+mc_df = mc_df.astype(
+    {
+        **{c: "category" for c in ("ProjectID",) if c in mc_df.columns},
+        **{c: "float32" for c in ("EAC_P50", "EAC_P80", "Finish_P50", "Finish_P80") if c in mc_df.columns},
+    },
+    copy=False,
+)
+proc_df = proc_df.astype(
+    {
+        **{c: "category" for c in ("ProjectID", "WBS", "Vendor") if c in proc_df.columns},
+        **{c: "int32" for c in ("DelayDays",) if c in proc_df.columns},
+    },
+    copy=False,
+)
+
+
+def _project_ids(s: pd.Series) -> List[str]:
+    """Sorted unique project IDs. For the categorical key columns above this
+    reads the (already sorted, NaN-free) category index directly — no full
+    column scan per rerun."""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        return list(s.cat.categories)
+    return sorted(s.dropna().unique().tolist())
+
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 6) AI UTILITIES — rule-based fallback + optional LLM
 # ──────────────────────────────────────────────────────────────────────────────
+def ensure_datetime(s: pd.Series) -> pd.Series:
+    """Return s as datetime64, skipping the O(N) to_datetime walk when the
+    parquet reader already delivered a timestamp column."""
+    return s if pd.api.types.is_datetime64_any_dtype(s) else pd.to_datetime(s, errors="coerce")
+
+
+@st.cache_data(show_spinner=False)
+def latest_per_wbs(evm: pd.DataFrame) -> pd.DataFrame:
+    """
+    Latest row per (ProjectID, WBS) projected to the KPI columns — the most
+    expensive pandas pipeline in the app, shared (and cached) between the KPI
+    tab and build_portfolio_summary instead of being run twice per rerun.
+    """
+    cols = [c for c in ("ProjectID", "WBS", "Period", "CPI", "SPI", "EAC", "VAC", "BAC") if c in evm.columns]
+    d = evm[cols]
+    if "Period" not in d.columns:
+        return d
+    d = d.assign(Period=ensure_datetime(d["Period"]))
+    return (
+        d.sort_values("Period", kind="stable")
+        .groupby(["ProjectID", "WBS"], as_index=False, sort=False, observed=True)
+        .tail(1)
+    )
+
+
+@st.cache_data(show_spinner=False)
+def per_project_kpis(evm: pd.DataFrame, cpi_thr: float, spi_thr: float) -> pd.DataFrame:
+    """
+    Per-project partial aggregates (KPI sums/counts and red-flag counts) over
+    the latest-per-WBS rows, computed once per data version. The portfolio
+    summary combines the selected projects' rows from this table, so a
+    multiselect toggle costs O(#selected) arithmetic instead of a fresh
+    filter + groupby over the full timeseries.
+
+    The red thresholds are arguments (not read from CFG inside) so that a
+    config.yaml edit changes the cache key and recomputes the flag counts.
+    """
+    latest = latest_per_wbs(evm)
+    flags = {}
+    if "CPI" in latest.columns:
+        flags["red_cpi"] = latest["CPI"] < cpi_thr
+    if "SPI" in latest.columns:
+        flags["red_spi"] = latest["SPI"] < spi_thr
+    d = latest.assign(**flags)
+    aggs: Dict[str, Tuple[str, str]] = {}
+    for col, (sum_key, n_key) in {"CPI": ("cpi_sum", "cpi_n"), "SPI": ("spi_sum", "spi_n")}.items():
+        if col in d.columns:
+            aggs[sum_key] = (col, "sum")
+            aggs[n_key] = (col, "count")
+    for col, sum_key in {"EAC": "eac_sum", "VAC": "vac_sum"}.items():
+        if col in d.columns:
+            aggs[sum_key] = (col, "sum")
+    for col in ("red_cpi", "red_spi"):
+        if col in d.columns:
+            aggs[col] = (col, "sum")
+    if not aggs or "ProjectID" not in d.columns:
+        return pd.DataFrame()
+    return d.groupby("ProjectID", observed=True).agg(**aggs)
+
+
+@st.cache_data(show_spinner=False)
 def build_portfolio_summary(
-    evm: pd.DataFrame, mc: pd.DataFrame, proc: pd.DataFrame, projects: Optional[List[Any]] = None
+    evm: pd.DataFrame,
+    mc: pd.DataFrame,
+    proc: pd.DataFrame,
+    cpi_thr: float,
+    spi_thr: float,
+    projects: Optional[List[Any]] = None,
 ) -> Dict[str, Any]:
     """
-    Convert detailed tables into compact JSON for AI:
+    Convert detailed tables into compact JSON for AI (cached per input data +
+    thresholds + project selection, so repeated AI-tab renders skip the
+    groupbys and threshold edits in config.yaml invalidate the entry):
     - Latest CPI/SPI/EAC/VAC by WBS → portfolio stats
     - Monte Carlo P50/P80 per project
     - Top late procurement items
     """
-    # Optional project filter
+    # Portfolio stats come from the per-project aggregate table (cached once
+    # for the full data), reduced here over just the selected rows. MC and
+    # procurement filter as masked views; the cached inputs are never mutated,
+    # so no defensive full-frame copies.
+    stats = per_project_kpis(evm, cpi_thr, spi_thr)
     if projects:
-        evm_f = evm[evm["ProjectID"].isin(projects)].copy()
-        mc_f = mc[mc["ProjectID"].isin(projects)].copy()
-        proc_f = proc[proc["ProjectID"].isin(projects)] if "ProjectID" in proc.columns else proc.copy()
+        stats = stats[stats.index.isin(projects)]
+        mc_f = mc[mc["ProjectID"].isin(projects)]
+        proc_f = proc[proc["ProjectID"].isin(projects)] if "ProjectID" in proc.columns else proc
     else:
-        evm_f, mc_f, proc_f = evm.copy(), mc.copy(), proc.copy()
-
-    # Latest row per WBS by Period
-    latest = evm_f.copy()
-    if "Period" in latest.columns:
-        latest["Period"] = pd.to_datetime(latest["Period"], errors="coerce")
-        latest = latest.sort_values("Period").groupby(["ProjectID", "WBS"], as_index=False).tail(1)
-
-    cpi_mean = float(latest["CPI"].mean()) if "CPI" in latest.columns and len(latest) else None
-    spi_mean = float(latest["SPI"].mean()) if "SPI" in latest.columns and len(latest) else None
-    eac_total = float(latest["EAC"].sum()) if "EAC" in latest.columns and len(latest) else None
-    vac_total = float(latest["VAC"].sum()) if "VAC" in latest.columns and len(latest) else None
-
-    # Red flags by thresholds — mypy-safe (Series.sum only when column exists)
-    cpi_thr = float(CFG["thresholds"]["cpi_red"])
-    spi_thr = float(CFG["thresholds"]["spi_red"])
-    red_cpi_count = int((latest["CPI"] < cpi_thr).sum()) if "CPI" in latest.columns else 0
-    red_spi_count = int((latest["SPI"] < spi_thr).sum()) if "SPI" in latest.columns else 0
-
-    # Monte Carlo records summarized
-    mc_records: List[Dict[str, float | Any]] = []
-    for _, r in mc_f.iterrows():
-        mc_records.append(
-            {
-                "ProjectID": r.get("ProjectID"),
-                "EAC_P50": float(r.get("EAC_P50", 0.0)),
-                "EAC_P80": float(r.get("EAC_P80", 0.0)),
-                "Finish_P50": float(r.get("Finish_P50", 0.0)),
-                "Finish_P80": float(r.get("Finish_P80", 0.0)),
-            }
-        )
+        mc_f, proc_f = mc, proc
+
+    def _mean_of(sum_key: str, n_key: str) -> Optional[float]:
+        if n_key not in stats.columns:
+            return None
+        n = int(stats[n_key].sum())
+        return float(stats[sum_key].sum() / n) if n else None
+
+    cpi_mean = _mean_of("cpi_sum", "cpi_n")
+    spi_mean = _mean_of("spi_sum", "spi_n")
+    eac_total = float(stats["eac_sum"].sum()) if "eac_sum" in stats.columns and len(stats) else None
+    vac_total = float(stats["vac_sum"].sum()) if "vac_sum" in stats.columns and len(stats) else None
+
+    red_cpi_count = int(stats["red_cpi"].sum()) if "red_cpi" in stats.columns else 0
+    red_spi_count = int(stats["red_spi"].sum()) if "red_spi" in stats.columns else 0
+
+    # Monte Carlo records summarized — one reindex+cast+to_dict instead of
+    # per-row iterrows boxing (absent columns become 0.0, like r.get did)
+    mc_cols = ["EAC_P50", "EAC_P80", "Finish_P50", "Finish_P80"]
+    mc_sub = mc_f.reindex(columns=["ProjectID", *mc_cols]).fillna({c: 0.0 for c in mc_cols})
+    mc_sub[mc_cols] = mc_sub[mc_cols].astype("float64", copy=False)
+    mc_records: List[Dict[str, float | Any]] = mc_sub.to_dict(orient="records")
+
+    # Risky-forecast flag as one boolean reduction over the frame, so the AI
+    # tab doesn't rescan the record dicts on every render
+    mc_risky_any = bool(
+        ((mc_sub["EAC_P80"] > 1.05 * mc_sub["EAC_P50"]) | (mc_sub["Finish_P80"] > mc_sub["Finish_P50"] + 10)).any()
+    )
 
-    # Top procurement delays — cast to precise type for mypy
-    worst_list: List[Dict[str, Any]] = []
+    # Top procurement delays — nlargest heap-selects the top 10 in O(N log k)
+    # instead of fully sorting the frame, and the rows serialize straight to
+    # JSON (their only consumer is the prompt text): no dict-per-row step.
+    worst_json = "[]"
     if "DelayDays" in proc_f.columns and len(proc_f):
-        worst_list = cast(
-            List[Dict[str, Any]],
-            proc_f.sort_values("DelayDays", ascending=False).head(10).to_dict(orient="records"),
-        )
+        worst_json = proc_f.nlargest(10, "DelayDays").to_json(orient="records")
 
     return {
         "portfolio": {
@@ -509,7 +883,8 @@ def build_portfolio_summary(
             "spi_threshold": spi_thr,
         },
         "monte_carlo": mc_records,
-        "procurement_top_delays": worst_list,
+        "monte_carlo_risky": mc_risky_any,
+        "procurement_top_delays_json": worst_json,
     }
 
 
@@ -543,21 +918,24 @@ def rule_based_recs(summary: Dict[str, Any]) -> str:
     else:
         lines.append("   • SPI acceptable. Maintain rolling-wave updates and float monitoring.")
 
-    delays = summary.get("procurement_top_delays", [])
+    worst_json = summary.get("procurement_top_delays_json") or "[]"
     lines.append("3) **Procurement Acceleration**")
-    if delays:
+    if worst_json != "[]" or summary.get("procurement_top_delays"):
         lines.append("   • Daily expeditor huddles; enforce LDs; line up alternates for top late items.")
     else:
         lines.append("   • On-time vendors. Keep scorecards and SLAs enforced.")
 
-    mc = summary.get("monte_carlo", [])
-    risky = [
-        m
-        for m in mc
-        if m.get("EAC_P80", 0) > 1.05 * m.get("EAC_P50", 0) or m.get("Finish_P80", 0) > m.get("Finish_P50", 0) + 10
-    ]
+    # Prefer the flag precomputed as a vectorized reduction in
+    # build_portfolio_summary; fall back to scanning the records for
+    # summaries built elsewhere.
+    risky_any = summary.get("monte_carlo_risky")
+    if risky_any is None:
+        risky_any = any(
+            m.get("EAC_P80", 0) > 1.05 * m.get("EAC_P50", 0) or m.get("Finish_P80", 0) > m.get("Finish_P50", 0) + 10
+            for m in summary.get("monte_carlo", [])
+        )
     lines.append("4) **Forecasting Discipline**")
-    if risky:
+    if risky_any:
         lines.append("   • Where P80 ≫ P50, brief execs on **P80**; fund mitigations from contingency.")
     else:
         lines.append("   • P50/P80 spread controlled; maintain trend checks and hold P80 in reserve.")
@@ -567,16 +945,33 @@ def rule_based_recs(summary: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def _summary_json(summary: Dict[str, Any]) -> str:
+    """
+    Deterministic indented JSON for the LLM prompt and the response cache key.
+    Sorted keys keep the text stable for identical summaries (reliable
+    memoization); orjson does the encode when installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(summary, indent=2, sort_keys=True)
+
+
 def try_llm_then_rules(summary: Dict[str, Any], temperature: float = 0.2) -> Tuple[str, str]:
     """
     Try cloud LLMs (OpenAI/Anthropic/Groq) if keys exist; otherwise return rule-based text.
     Returns (text, source_model).
     """
+    # The top-delays rows arrive pre-serialized from build_portfolio_summary
+    # (DataFrame.to_json straight off the frame); splice that string into the
+    # prompt rather than round-tripping it through json.dumps a second time.
+    body = dict(summary)
+    worst_json = body.pop("procurement_top_delays_json", "[]")
     prompt = (
         "You are a Principal Project Controls AI. Summarize risks and produce a numbered action plan "
         "to prevent cost overruns and schedule slips, referencing CPI/SPI thresholds, procurement delays, "
         "and P50/P80 Monte Carlo. Limit to ~200 words.\n\n"
-        f"{json.dumps(summary, indent=2)}"
+        f"{_summary_json(body)}\n\n"
+        f"Top procurement delays (JSON records): {worst_json}"
     )
 
     openai_key = os.getenv("OPENAI_API_KEY", "").strip()
@@ -644,6 +1039,36 @@ def try_llm_then_rules(summary: Dict[str, Any], temperature: float = 0.2) -> Tup
     return rule_based_recs(summary), "Rule-based expert system"
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _llm_cached(summary_json: str, provider_sig: str, model: str, temperature: float) -> Tuple[str, str]:
+    """
+    Memoized front for try_llm_then_rules: an unchanged portfolio summary
+    (same data, projects, provider, and model) reuses the previous response
+    instead of paying the network round trip again. provider_sig carries the
+    names of the configured key env vars, never their values.
+    """
+    return try_llm_then_rules(json.loads(summary_json), temperature=temperature)
+
+
+def _kpi_card(label: str, value: str) -> str:
+    """One kpi-card div as an HTML string, for joining into a single markdown call."""
+    return f'<div class="kpi-card"><div class="kpi-label">{label}</div><div class="kpi-value">{value}</div></div>'
+
+
+def _kpi_row(cards: List[str]) -> None:
+    """
+    Render a row of KPI cards with ONE st.markdown call. Each st.markdown is a
+    separate Streamlit delta round-trip, so emitting a flex container holding
+    all the cards costs one message instead of four (and drops the st.columns
+    layout elements entirely).
+    """
+    if cards:
+        st.markdown(
+            '<div style="display:flex;gap:12px">' + "".join(cards) + "</div>",
+            unsafe_allow_html=True,
+        )
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # 7) MAIN TABS — KPIs, Forecast, Procurement, Alerts, AI Copilot
 # ──────────────────────────────────────────────────────────────────────────────
@@ -652,36 +1077,18 @@ tab_kpi, tab_fc, tab_proc, tab_alerts, tab_ai = st.tabs(["KPIs", "Forecast", "Pr
 # --- KPIs TAB ---------------------------------------------------------------
 with tab_kpi:
     st.subheader("Portfolio KPIs (latest per WBS)")
-    latest = evm_df.copy()
-    if "Period" in latest.columns:
-        latest["Period"] = pd.to_datetime(latest["Period"], errors="coerce")
-        latest = latest.sort_values("Period").groupby(["ProjectID", "WBS"], as_index=False).tail(1)
+    latest = latest_per_wbs(evm_df)
 
-    c1, c2, c3, c4 = st.columns(4)
+    kpi_cards: List[str] = []
     if "CPI" in latest.columns and len(latest):
-        c1.markdown(
-            f'<div class="kpi-card"><div class="kpi-label">Avg CPI</div>'
-            f'<div class="kpi-value">{latest["CPI"].mean():.2f}</div></div>',
-            unsafe_allow_html=True,
-        )
+        kpi_cards.append(_kpi_card("Avg CPI", f"{latest['CPI'].mean():.2f}"))
     if "SPI" in latest.columns and len(latest):
-        c2.markdown(
-            f'<div class="kpi-card"><div class="kpi-label">Avg SPI</div>'
-            f'<div class="kpi-value">{latest["SPI"].mean():.2f}</div></div>',
-            unsafe_allow_html=True,
-        )
+        kpi_cards.append(_kpi_card("Avg SPI", f"{latest['SPI'].mean():.2f}"))
     if "EAC" in latest.columns and len(latest):
-        c3.markdown(
-            f'<div class="kpi-card"><div class="kpi-label">Total EAC</div>'
-            f'<div class="kpi-value">${latest["EAC"].sum():,.0f}</div></div>',
-            unsafe_allow_html=True,
-        )
+        kpi_cards.append(_kpi_card("Total EAC", f"${latest['EAC'].sum():,.0f}"))
     if "VAC" in latest.columns and len(latest):
-        c4.markdown(
-            f'<div class="kpi-card"><div class="kpi-label">Total VAC</div>'
-            f'<div class="kpi-value">${latest["VAC"].sum():,.0f}</div></div>',
-            unsafe_allow_html=True,
-        )
+        kpi_cards.append(_kpi_card("Total VAC", f"${latest['VAC'].sum():,.0f}"))
+    _kpi_row(kpi_cards)
 
     show_cols = [c for c in ["ProjectID", "WBS", "CPI", "SPI", "EAC", "VAC", "BAC", "Period"] if c in latest.columns]
     st.dataframe(latest[show_cols], use_container_width=True)
@@ -689,90 +1096,52 @@ with tab_kpi:
 # --- FORECAST TAB -----------------------------------------------------------
 with tab_fc:
     st.subheader("Forecast (Monte Carlo)")
-    proj_ids = sorted(mc_df["ProjectID"].dropna().unique().tolist())
+    proj_ids = _project_ids(mc_df["ProjectID"])
     selected_proj = st.selectbox("Select Project", proj_ids, index=0 if proj_ids else None)
 
     row = mc_df[mc_df["ProjectID"] == selected_proj].head(1)
-    c1, c2, c3, c4 = st.columns(4)
     if not row.empty:
-        c1.markdown(
-            f'<div class="kpi-card"><div class="kpi-label">EAC P50</div>'
-            f'<div class="kpi-value">${row["EAC_P50"].iloc[0]:,.0f}</div></div>',
-            unsafe_allow_html=True,
-        )
-        c2.markdown(
-            f'<div class="kpi-card"><div class="kpi-label">EAC P80</div>'
-            f'<div class="kpi-value">${row["EAC_P80"].iloc[0]:,.0f}</div></div>',
-            unsafe_allow_html=True,
-        )
-        c3.markdown(
-            f'<div class="kpi-card"><div class="kpi-label">Finish P50 (days)</div>'
-            f'<div class="kpi-value">{row["Finish_P50"].iloc[0]:,.1f} d</div></div>',
-            unsafe_allow_html=True,
-        )
-        c4.markdown(
-            f'<div class="kpi-card"><div class="kpi-label">Finish P80 (days)</div>'
-            f'<div class="kpi-value">{row["Finish_P80"].iloc[0]:,.1f} d</div></div>',
-            unsafe_allow_html=True,
+        _kpi_row(
+            [
+                _kpi_card("EAC P50", f"${row['EAC_P50'].iloc[0]:,.0f}"),
+                _kpi_card("EAC P80", f"${row['EAC_P80'].iloc[0]:,.0f}"),
+                _kpi_card("Finish P50 (days)", f"{row['Finish_P50'].iloc[0]:,.1f} d"),
+                _kpi_card("Finish P80 (days)", f"{row['Finish_P80'].iloc[0]:,.1f} d"),
+            ]
         )
 
     st.divider()
-    # S-curve for EAC (CDF)
-    if scurve_df is not None and len(scurve_df):
-        scurve_df = cast(pd.DataFrame, scurve_df)  # narrow Optional for mypy
-        sc_proj = scurve_df[(scurve_df["ProjectID"] == selected_proj) & (scurve_df["Metric"] == "EAC")]
-        if len(sc_proj):
-            fig_sc = px.line(
-                sc_proj.sort_values("Value"),
-                x="Value",
-                y="CDF",
-                title=f"EAC S-curve (CDF) — {selected_proj}",
-                labels={"Value": "EAC ($)", "CDF": "Cumulative Probability"},
-            )
-            fig_sc.update_layout(yaxis=dict(range=[0, 1]))
-            st.plotly_chart(fig_sc, use_container_width=True)
-        else:
-            st.info("No S-curve points for this project.")
-    else:
+    # S-curve for EAC (CDF) — figure payload cached per (file version, project)
+    fig_sc = scurve_fig(SCURVE_FP, selected_proj)
+    if fig_sc is None:
         st.info("S-curve file not found (forecast_s_curves.parquet).")
+    elif not fig_sc:
+        st.info("No S-curve points for this project.")
+    else:
+        st.plotly_chart(fig_sc, use_container_width=True)
 
     st.divider()
-    # Histogram: finish days over baseline
-    if runs_df is not None and len(runs_df):
-        runs_df = cast(pd.DataFrame, runs_df)  # narrow Optional for mypy
-        rproj = runs_df[runs_df["ProjectID"] == selected_proj]
-        if len(rproj):
-            fig_hist = px.histogram(
-                rproj,
-                x="FinishDaysOverBaseline",
-                nbins=30,
-                title=f"Finish Days over Baseline — Distribution — {selected_proj}",
-                labels={"FinishDaysOverBaseline": "Days over baseline"},
-            )
-            st.plotly_chart(fig_hist, use_container_width=True)
-        else:
-            st.info("No Monte Carlo runs for this project.")
-    else:
+    # Histogram: finish days over baseline — same cached-payload pattern
+    fig_hist = runs_hist_fig(RUNS_FP, selected_proj)
+    if fig_hist is None:
         st.info("Runs file not found (monte_carlo_runs.parquet).")
+    elif not fig_hist:
+        st.info("No Monte Carlo runs for this project.")
+    else:
+        st.plotly_chart(fig_hist, use_container_width=True)
 
 # --- PROCUREMENT TAB --------------------------------------------------------
 with tab_proc:
     st.subheader("Procurement Impacts")
-    show_proc = proc_df.loc[:, [c for c in proc_df.columns if c != "Unnamed: 0"]]
-    st.dataframe(show_proc, use_container_width=True)
+    # The loader's column registry already excludes stray columns like the
+    # legacy "Unnamed: 0" CSV index, so the frame renders as-is.
+    st.dataframe(proc_df, use_container_width=True)
 
 # --- ALERTS TAB -------------------------------------------------------------
 with tab_alerts:
     st.subheader("Alerts Outbox (dry-run history)")
-    if alerts_text:
-        try:
-            at = alerts_text.strip()
-            if at.startswith("{") or at.startswith("["):
-                st.json(json.loads(at))  # pretty JSON if possible
-            else:
-                st.text(alerts_text)
-        except Exception:
-            st.text(alerts_text)
+    if alerts_obj is not None:
+        st.json(alerts_obj)  # already parsed (and cached) at load time
     else:
         st.info("No alerts yet. Generate in AI Copilot tab or via:\n`python -m services.alerts`")
 
@@ -782,7 +1151,7 @@ with tab_ai:
     st.caption("Analyzes CPI/SPI, P50/P80, and procurement to suggest actions to prevent overruns and delays.")
 
     # Optional: choose projects to analyze
-    plist = sorted(evm_df["ProjectID"].dropna().unique().tolist())
+    plist = _project_ids(evm_df["ProjectID"])
     selected_projects = st.multiselect("Projects to analyze", plist, default=plist)
 
     # Initialize session state fields
@@ -793,8 +1162,23 @@ with tab_ai:
     # Generate the AI recommendations (LLM if keys available, else rule-based)
     if st.button("⚡ Generate AI Recommendations", use_container_width=True):
         with st.spinner("Analyzing portfolio…"):
-            summary = build_portfolio_summary(evm_df, mc_df, proc_df, projects=selected_projects)
-            ai_text, used_model = try_llm_then_rules(summary, temperature=float(CFG["ai"]["temperature"]))
+            summary = build_portfolio_summary(
+                evm_df,
+                mc_df,
+                proc_df,
+                float(CFG["thresholds"]["cpi_red"]),
+                float(CFG["thresholds"]["spi_red"]),
+                projects=selected_projects,
+            )
+            provider_sig = "|".join(
+                k for k in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GROQ_API_KEY") if os.getenv(k, "").strip()
+            )
+            ai_text, used_model = _llm_cached(
+                _summary_json(summary),
+                provider_sig,
+                os.getenv("LLM_MODEL", ""),
+                float(CFG["ai"]["temperature"]),
+            )
             st.session_state.ai_text = ai_text
             st.session_state.ai_source = used_model
             PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
@@ -822,43 +1206,29 @@ with tab_ai:
     send_disabled = not (use_jira or use_slack or use_email)
     if st.button("📨 Create Ticket(s) from AI Plan", use_container_width=True, disabled=send_disabled):
         with st.spinner("Dispatching alerts via services.alerts…"):
-            python = sys.executable
-            base_cmd = [python, "-m", "services.alerts"]
-            if use_jira:
-                base_cmd.append("--jira")
-            if use_slack:
-                base_cmd.append("--slack")
-            if use_email:
-                base_cmd.append("--email")
-
-            # Prefer attaching the AI note file if CLI supports --note
-            cmd_with_note = base_cmd + ["--note", str(AI_NOTE_FP)]
-            code, out, err = run_command(cmd_with_note, cwd=ROOT)
-
-            if code != 0:
-                # Retry without --note for older CLI compatibility
-                code2, out2, err2 = run_command(base_cmd, cwd=ROOT)
-                if code2 == 0:
-                    st.warning("Alert pipeline ran without attaching the AI note (CLI may not support --note).")
-                    st.success("Alerts dispatched (check alerts_outbox.json).")
-                    with st.expander("Alert output (retry without --note)"):
-                        st.code(out2 or "<no stdout>")
-                        if err2:
-                            st.code(err2)
-                else:
-                    st.error("Alert pipeline failed. See logs below.")
-                    with st.expander("services.alerts output (both attempts)"):
-                        st.markdown("**Attempt with --note:**")
-                        st.code(out or "<no stdout>")
-                        if err:
-                            st.code(err)
-                        st.markdown("**Attempt without --note:**")
-                        st.code(out2 or "<no stdout>")
-                        if err2:
-                            st.code(err2)
+            # Run the pipeline in-process: services.alerts.main is a plain
+            # importable function (the tests call it the same way), so there is
+            # no interpreter spawn + pandas/pyarrow re-import per click.
+            if str(ROOT) not in sys.path:
+                sys.path.insert(0, str(ROOT))
+            from services.alerts import main as alerts_main
+
+            buf = io.StringIO()
+            try:
+                with contextlib.redirect_stdout(buf):
+                    # Config is already parsed for the app; hand it over instead
+                    # of having alerts re-read the YAML file.
+                    alerts_main(
+                        None,
+                        str(PROCESSED_DIR),
+                        dry_run=bool(CFG["alerts"].get("dry_run", True)),
+                        config_obj=CFG,
+                    )
+            except Exception as e:
+                st.error(f"Alert pipeline failed: {e}")
+                with st.expander("services.alerts output"):
+                    st.code(buf.getvalue() or "<no stdout>")
             else:
                 st.success("Alerts dispatched and (dry-run) ticket(s) created. See alerts_outbox.json.")
                 with st.expander("services.alerts output"):
-                    st.code(out or "<no stdout>")
-                    if err:
-                        st.code(err)
+                    st.code(buf.getvalue() or "<no stdout>")
@@ -7,9 +7,13 @@ without requiring real project files.
 """
 
 import sys
+from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 # --- Add repo root so "import services" works in tests & CI ---
@@ -18,9 +22,9 @@ if str(_repo_root) not in sys.path:
     sys.path.insert(0, str(_repo_root))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def schedule_df() -> pd.DataFrame:
-    """Provides a minimal project schedule DataFrame."""
+    """Provides a minimal project schedule DataFrame (session-scoped; treat as immutable)."""
     return pd.DataFrame(
         {
             "ProjectID": ["P1", "P1"],
@@ -28,12 +32,12 @@ def schedule_df() -> pd.DataFrame:
             "PercentComplete": [0.50, 0.20],
             "BAC": [1000.0, 2000.0],
         }
-    )
+    ).astype({"ProjectID": "category", "WBS": "category"})
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cost_df() -> pd.DataFrame:
-    """Provides a minimal project cost ledger DataFrame."""
+    """Provides a minimal project cost ledger DataFrame (session-scoped; treat as immutable)."""
     return pd.DataFrame(
         {
             "ProjectID": ["P1", "P1", "P1"],
@@ -42,4 +46,218 @@ def cost_df() -> pd.DataFrame:
             "ActualCost": [400.0, 150.0, 250.0],
             "Budget": [500.0, 100.0, 200.0],
         }
+    ).astype({"ProjectID": "category", "WBS": "category", "Period": "category"})
+
+
+@pytest.fixture(scope="session")
+def evm_result(schedule_df: pd.DataFrame, cost_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    compute_metrics over the shared schedule/cost fixtures, ONCE per session.
+
+    Tests that validate different facets of the same run (shape vs. math)
+    read this frame instead of each re-running the pipeline.
+    """
+    from etl.evm_calculator import compute_metrics
+
+    return compute_metrics(schedule_df, cost_df)
+
+
+def _write_test_parquet(df: pd.DataFrame, path: Path) -> None:
+    """
+    Fast-path parquet write for tiny fixture frames: skip compression,
+    dictionary encoding, and column statistics. At 1-3 rows the footer/thrift
+    overhead dominates, so everything optional is turned off.
+    """
+    pq.write_table(
+        pa.Table.from_pandas(df, preserve_index=False),
+        path,
+        compression=None,
+        use_dictionary=False,
+        write_statistics=False,
     )
+
+
+@pytest.fixture(scope="session")
+def write_test_parquet():
+    """The fast-path fixture writer, for tests that build their own frames."""
+    return _write_test_parquet
+
+
+@pytest.fixture(scope="session")
+def minimal_processed(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Tiny EVM + Monte Carlo parquet pair, written ONCE per session.
+
+    Parquet encode has a fixed per-file cost that dwarfs these 2-3 row frames,
+    so tests that only need "some plausible processed outputs" copy this
+    directory into their own tmp_path (shutil.copytree) instead of re-encoding
+    parquet per test. Tests that pin exact cell values still write their own.
+    """
+    d = tmp_path_factory.mktemp("minimal_processed")
+    # Two projects so project filtering is exercised; P1 breaches the default
+    # CPI/SPI thresholds so alert runs produce a non-empty outbox.
+    # Built as Arrow tables directly — no pandas frame construction or
+    # pandas→Arrow schema mapping for write-only fixture data.
+    evm = pa.table(
+        {
+            "ProjectID": ["P1", "P1", "P2"],
+            "WBS": ["W1", "W2", "W1"],
+            "Period": pa.array(
+                [datetime(2025, 1, 1), datetime(2025, 2, 1), datetime(2025, 1, 1)],
+                type=pa.timestamp("ns"),
+            ),
+            "CPI": [0.88, 0.92, 1.05],
+            "SPI": [0.80, 0.97, 1.02],
+            "EAC": [1_020_000.0, 1_070_000.0, 300_000.0],
+            "VAC": [-20_000.0, -70_000.0, 10_000.0],
+            "BAC": [1_000_000.0, 1_000_000.0, 310_000.0],
+        }
+    )
+    mc = pa.table(
+        {
+            "ProjectID": ["P1", "P2"],
+            "EAC_P50": [1_000_000.0, 280_000.0],
+            "EAC_P80": [1_080_000.0, 320_000.0],
+            "Finish_P50": [10.0, 5.0],
+            "Finish_P80": [25.0, 12.0],
+        }
+    )
+    for tbl, name in ((evm, "evm_timeseries.parquet"), (mc, "monte_carlo_summary.parquet")):
+        pq.write_table(tbl, d / name, compression=None, use_dictionary=False, write_statistics=False)
+    return d
+
+
+@pytest.fixture(scope="session")
+def minimal_samples(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Tiny schedule/cost CSV pair for the ETL CLI tests, written once per
+    session; tests copy the directory into their tmp workspace.
+    """
+    d = tmp_path_factory.mktemp("minimal_samples")
+    pd.DataFrame(
+        {
+            "ProjectID": ["P1", "P1"],
+            "WBS": ["W1", "W2"],
+            "PercentComplete": [0.5, 0.25],
+            "BAC": [1000.0, 2000.0],
+        }
+    ).to_csv(d / "schedule_activities.csv", index=False)
+    pd.DataFrame(
+        {
+            "ProjectID": ["P1", "P1"],
+            "WBS": ["W1", "W2"],
+            "Period": ["2025-01", "2025-02"],
+            "ActualCost": [400.0, 250.0],
+            "Budget": [500.0, 200.0],
+        }
+    ).to_csv(d / "cost_erp.csv", index=False)
+    return d
+
+
+@pytest.fixture(scope="session")
+def evm_sample_kpis() -> pd.DataFrame:
+    """
+    compute_kpis over the golden sample CSV, computed ONCE per session.
+
+    Neither the checked-in sample nor the KPI math changes between tests, so
+    golden-value tests read this precomputed frame instead of re-parsing the
+    CSV and re-running the pipeline per invocation.
+    """
+    from services.evm_metrics import compute_kpis
+
+    df = pd.read_csv(_repo_root / "data" / "samples" / "evm_sample.csv")
+    return compute_kpis(df)
+
+
+@pytest.fixture(scope="session")
+def evm_cases() -> dict:
+    """
+    compute_metrics output per named input case, computed ONCE per session.
+
+    The evm_calculator test files used to carry near-identical schedule/cost
+    builders and re-run compute_metrics on tiny inputs per test; each case
+    here is the (schedule, cost) pair one of them exercised, keyed by what it
+    probes. Tests read the precomputed result frame (and must not mutate it).
+    """
+    from etl.evm_calculator import compute_metrics
+
+    inputs = {
+        # Primary path: multiple projects/WBS across two periods
+        "core": (
+            pd.DataFrame(
+                {
+                    "ProjectID": ["P1", "P1", "P2"],
+                    "WBS": ["W1", "W2", "W1"],
+                    "PercentComplete": [0.50, 0.25, 0.40],
+                    "BAC": [1000.0, 2000.0, 500.0],
+                }
+            ),
+            pd.DataFrame(
+                {
+                    "ProjectID": ["P1", "P1", "P1", "P2"],
+                    "WBS": ["W1", "W2", "W2", "W1"],
+                    "Period": ["2025-01", "2025-01", "2025-02", "2025-01"],
+                    "ActualCost": [400.0, 150.0, 250.0, 120.0],
+                    "Budget": [500.0, 100.0, 200.0, 150.0],
+                }
+            ),
+        ),
+        # CSV messiness: stringy number + blank → to_numeric coercion fires on
+        # any string, so one row is enough to exercise the branch
+        "stringy": (
+            pd.DataFrame({"ProjectID": ["P1"], "WBS": ["W1"], "PercentComplete": [0.60], "BAC": [1000.0]}),
+            pd.DataFrame(
+                {"ProjectID": ["P1"], "WBS": ["W1"], "Period": ["2025-01"], "ActualCost": ["400"], "Budget": [""]}
+            ),
+        ),
+        # PV = 0 and AC = 0 → safe-divide guards
+        "zero_pv_ac": (
+            pd.DataFrame({"ProjectID": ["PZ"], "WBS": ["W1"], "PercentComplete": [0.0], "BAC": [1000.0]}),
+            pd.DataFrame(
+                {"ProjectID": ["PZ"], "WBS": ["W1"], "Period": ["2025-01"], "ActualCost": [0.0], "Budget": [0.0]}
+            ),
+        ),
+        # Minimal single-row inputs → derived/optional columns
+        "minimal": (
+            pd.DataFrame({"ProjectID": ["PM"], "WBS": ["W1"], "PercentComplete": [0.3], "BAC": [2000.0]}),
+            pd.DataFrame(
+                {"ProjectID": ["PM"], "WBS": ["W1"], "Period": ["2025-02"], "ActualCost": [500.0], "Budget": [600.0]}
+            ),
+        ),
+        # BAC = 0 with two periods → EAC/VAC fallbacks + latest-row-wins
+        "bac_zero_multi_period": (
+            pd.DataFrame(
+                {"ProjectID": ["PX", "PX"], "WBS": ["W1", "W1"], "PercentComplete": [0.5, 0.6], "BAC": [0.0, 0.0]}
+            ),
+            pd.DataFrame(
+                {
+                    "ProjectID": ["PX", "PX"],
+                    "WBS": ["W1", "W1"],
+                    "Period": ["2025-01", "2025-02"],
+                    "ActualCost": [100.0, 150.0],
+                    "Budget": [120.0, 180.0],
+                }
+            ),
+        ),
+        # BAC = NaN on latest schedule row, zero PV/AC on latest period
+        "nan_bac_zero_latest": (
+            pd.DataFrame(
+                {
+                    "ProjectID": ["Z1", "Z1"],
+                    "WBS": ["W1", "W1"],
+                    "PercentComplete": [0.4, 0.6],
+                    "BAC": [10_000.0, np.nan],
+                }
+            ),
+            pd.DataFrame(
+                {
+                    "ProjectID": ["Z1", "Z1"],
+                    "WBS": ["W1", "W1"],
+                    "Period": ["2025-01", "2025-02"],
+                    "ActualCost": [2_000.0, 0.0],
+                    "Budget": [2_500.0, 0.0],
+                }
+            ),
+        ),
+    }
+    return {name: compute_metrics(sched, cost) for name, (sched, cost) in inputs.items()}
@@ -6,7 +6,7 @@
 #   uncovered lines near the outbox write path in services/alerts.py.
 #
 # What it does:
-#   - Writes minimal EVM + MC (includes BAC for float casting)
+#   - Copies the session-scoped minimal EVM + MC parquet fixtures
 #   - Writes a minimal config with dry_run true
 #   - Runs alerts.main twice (second run appends)
 #   - Ensures outbox JSON exists and has at least 2 items after second run
@@ -15,41 +15,12 @@
 from __future__ import annotations
 
 import json
+import shutil
 from pathlib import Path
 
-import pandas as pd
-
 from services.alerts import main as alerts_main  # type: ignore
 
 
-def _prep_inputs(processed: Path) -> None:
-    processed.mkdir(parents=True, exist_ok=True)
-    # Minimal EVM row — include BAC to avoid float(None)
-    pd.DataFrame(
-        {
-            "ProjectID": ["PP"],
-            "WBS": ["W1"],
-            "Period": pd.to_datetime(["2025-01-01"]),
-            "CPI": [0.88],
-            "SPI": [0.80],
-            "EAC": [250000.0],
-            "VAC": [-20000.0],
-            "BAC": [270000.0],
-        }
-    ).to_parquet(processed / "evm_timeseries.parquet", index=False)
-
-    # Minimal MC summary
-    pd.DataFrame(
-        {
-            "ProjectID": ["PP"],
-            "EAC_P50": [240000.0],
-            "EAC_P80": [280000.0],
-            "Finish_P50": [10.0],
-            "Finish_P80": [20.0],
-        }
-    ).to_parquet(processed / "monte_carlo_summary.parquet", index=False)
-
-
 def _write_cfg(root: Path) -> Path:
     cfg = root / "config.yaml"
     cfg.write_text(
@@ -59,9 +30,9 @@ def _write_cfg(root: Path) -> Path:
     return cfg
 
 
-def test_alerts_append_when_ai_note_missing(tmp_path: Path) -> None:
+def test_alerts_append_when_ai_note_missing(tmp_path: Path, minimal_processed: Path) -> None:
     processed = tmp_path / "data" / "processed"
-    _prep_inputs(processed)
+    shutil.copytree(minimal_processed, processed)
     cfg = _write_cfg(tmp_path)
 
     # Intentionally DO NOT create ai_recommendations.txt → cover "missing note" path
@@ -58,7 +58,7 @@ def test_breach_alert_includes_trigger(tmp_path: Path):
     assert breach["kpis"]["EAC"] == 125.0
 
 
-def test_summary_alert_normalizes_legacy_key_and_writes_file(tmp_path: Path):
+def test_summary_alert_normalizes_legacy_key_and_writes_file(tmp_path: Path, write_test_parquet):
     processed = tmp_path / "data" / "processed"
     processed.mkdir(parents=True, exist_ok=True)
 
@@ -77,15 +77,13 @@ def test_summary_alert_normalizes_legacy_key_and_writes_file(tmp_path: Path):
             }
         ]
     )
-    evm_fp = processed / "evm_timeseries.parquet"
-    evm_fp.write_bytes(evm.to_parquet(index=False) or b"")
+    write_test_parquet(evm, processed / "evm_timeseries.parquet")
 
     # MC with legacy P80_EAC key to exercise normalization to EAC_P80
     mc = _make_mc_df(
         [{"ProjectID": "G1", "EAC_P50": 98000.0, "P80_EAC": 105000.0, "Finish_P50": 10.0, "Finish_P80": 12.0}]
     )
-    mc_fp = processed / "monte_carlo_summary.parquet"
-    mc_fp.write_bytes(mc.to_parquet(index=False) or b"")
+    write_test_parquet(mc, processed / "monte_carlo_summary.parquet")
 
     # Minimal config file
     cfg = tmp_path / "config.yaml"
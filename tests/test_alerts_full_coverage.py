@@ -6,7 +6,7 @@ import pandas as pd
 from services.alerts import main as alerts_main
 
 
-def test_alerts_empty_cfg_and_safe_float_and_first_of_none(tmp_path: Path):
+def test_alerts_empty_cfg_and_safe_float_and_first_of_none(tmp_path: Path, write_test_parquet):
     processed = tmp_path / "data" / "processed"
     processed.mkdir(parents=True, exist_ok=True)
 
@@ -25,12 +25,12 @@ def test_alerts_empty_cfg_and_safe_float_and_first_of_none(tmp_path: Path):
             }
         ]
     )
-    (processed / "evm_timeseries.parquet").write_bytes(evm.to_parquet(index=False) or b"")
+    write_test_parquet(evm, processed / "evm_timeseries.parquet")
 
     # MC: Use legacy P80_EAC and make both EAC values non-numeric strings to hit _safe_float -> None.
     # Omit Finish_* keys so _first_of(...) returns None for those candidates.
     mc = pd.DataFrame([{"ProjectID": "Q1", "EAC_P50": "not-a-number", "P80_EAC": "still-not-a-number"}])
-    (processed / "monte_carlo_summary.parquet").write_bytes(mc.to_parquet(index=False) or b"")
+    write_test_parquet(mc, processed / "monte_carlo_summary.parquet")
 
     # Empty YAML → yaml.safe_load returns None → load_cfg(...) falls back to {}
     cfg = tmp_path / "config.yaml"
@@ -2,12 +2,12 @@
 tests/test_evm_calculator_cli.py
 
 Goal:
-- Exercise the CLI (__main__) path of etl.evm_calculator to cover argparse + main().
-- Ensures the module writes its expected parquet output when run as a script.
+- Exercise the CLI orchestration (main()) of etl.evm_calculator.
+- Ensures the module writes its expected parquet output when run end to end.
 
 What this tests:
 - We provide tiny CSV inputs in a temp workspace.
-- We sanitize sys.argv so pytest's flags (like --cov) don't confuse argparse.
+- We call main() with explicit paths (the __main__ block only parses argv).
 - We assert that the expected output parquet exists and has the essential columns.
 
 Why it matters:
@@ -15,70 +15,40 @@ Why it matters:
   and hiring-manager demos.
 """
 
-import runpy
-import sys
+import shutil
 from pathlib import Path
 
 import pandas as pd
 
+from etl.evm_calculator import main as evm_main
 
-def _write_inputs(root: Path) -> None:
+
+def _write_inputs(root: Path, minimal_samples: Path) -> None:
     """
-    Create the minimal CSVs the CLI expects:
+    Provide the minimal CSVs the CLI expects (copied from the session-scoped
+    fixture dir):
     - data/samples/schedule_activities.csv
     - data/samples/cost_erp.csv
     """
-    samples = root / "data" / "samples"
-    processed = root / "data" / "processed"
-    samples.mkdir(parents=True, exist_ok=True)
-    processed.mkdir(parents=True, exist_ok=True)
-
-    # Schedule inputs
-    sched = pd.DataFrame(
-        {
-            "ProjectID": ["P1", "P1"],
-            "WBS": ["W1", "W2"],
-            "PercentComplete": [0.5, 0.25],
-            "BAC": [1000.0, 2000.0],
-        }
-    )
-    sched.to_csv(samples / "schedule_activities.csv", index=False)
+    shutil.copytree(minimal_samples, root / "data" / "samples")
+    (root / "data" / "processed").mkdir(parents=True, exist_ok=True)
 
-    # Cost inputs across 2 periods
-    cost = pd.DataFrame(
-        {
-            "ProjectID": ["P1", "P1"],
-            "WBS": ["W1", "W2"],
-            "Period": ["2025-01", "2025-02"],
-            "ActualCost": [400.0, 250.0],
-            "Budget": [500.0, 200.0],
-        }
-    )
-    cost.to_csv(samples / "cost_erp.csv", index=False)
 
-
-def test_evm_calculator_cli_writes_parquet(tmp_path, monkeypatch):
+def test_evm_calculator_cli_writes_parquet(tmp_path, minimal_samples):
     """
     Arrange:
-      - Temp repo root; write minimal input files.
+      - Temp repo root; copy minimal input files.
     Act:
-      - Change CWD to the temp root.
-      - Reset sys.argv to a barebones set the CLI expects (no pytest flags).
-      - Run the module as __main__ via runpy.
+      - Call etl.evm_calculator.main directly with explicit paths — the
+        __main__ block is a thin argparse wrapper around it, so this covers
+        the same orchestration without re-executing the module under runpy.
     Assert:
       - evm_timeseries.parquet exists with essential columns.
     """
     root = tmp_path
-    _write_inputs(root)
-    monkeypatch.chdir(root)
-
-    # Reset argv for argparse in the module:
-    # If your CLI supports custom args (--samples, --processed, --out), add them here.
-    # We keep defaults so it reads from data/samples and writes to data/processed.
-    monkeypatch.setattr(sys, "argv", ["etl.evm_calculator"])
+    _write_inputs(root, minimal_samples)
 
-    # Execute like: python -m etl.evm_calculator
-    runpy.run_module("etl.evm_calculator", run_name="__main__")
+    evm_main(str(root / "data" / "samples"), str(root / "data" / "processed"))
 
     # Verify output parquet
     out_fp = root / "data" / "processed" / "evm_timeseries.parquet"
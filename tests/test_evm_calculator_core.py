@@ -11,85 +11,49 @@ What this test covers:
 - Output shape and essential columns
 """
 
-import math
-
+import numpy as np
 import pandas as pd
 
-# Import the functions under test.
-# If your module exposes different names, adjust these imports.
-from etl.evm_calculator import compute_metrics
-
-
-def _schedule_df() -> pd.DataFrame:
-    """
-    Build a tiny schedule dataframe that looks like real inputs.
-    Columns:
-      - ProjectID, WBS, PercentComplete, BAC
-    """
-    return pd.DataFrame(
-        {
-            "ProjectID": ["P1", "P1", "P2"],
-            "WBS": ["W1", "W2", "W1"],
-            "PercentComplete": [0.50, 0.25, 0.40],
-            "BAC": [1000.0, 2000.0, 500.0],
-        }
-    )
-
 
-def _cost_df() -> pd.DataFrame:
-    """
-    Build a tiny cost dataframe across two periods.
-    Columns:
-      - ProjectID, WBS, Period (YYYY-MM), ActualCost, Budget
-    """
-    return pd.DataFrame(
-        {
-            "ProjectID": ["P1", "P1", "P1", "P2"],
-            "WBS": ["W1", "W2", "W2", "W1"],
-            "Period": ["2025-01", "2025-01", "2025-02", "2025-01"],
-            "ActualCost": [400.0, 150.0, 250.0, 120.0],
-            "Budget": [500.0, 100.0, 200.0, 150.0],
-        }
-    )
-
-
-def test_compute_metrics_core_kpis() -> None:
+def test_compute_metrics_core_kpis(evm_cases) -> None:
     """
     Act:
-      - Feed small schedule/cost tables to compute_metrics().
+      - Read the precomputed "core" compute_metrics() result (session fixture).
     Assert:
       - Output is non-empty and has basic EVM columns.
       - Latest-period CPI/SPI follow EV/AC and EV/PV definitions.
       - VAC = BAC - EAC (within float tolerance).
     """
-    out = compute_metrics(_schedule_df(), _cost_df())
+    out = evm_cases["core"]
 
     # Basic sanity
     assert not out.empty
     for col in ["ProjectID", "WBS", "Period", "EV", "PV", "AC", "BAC", "CPI", "SPI", "EAC", "VAC"]:
         assert col in out.columns, f"Expected column {col} in compute_metrics output"
 
-    # For each (ProjectID, WBS), take the latest Period row and validate KPI math
-    latest = (
-        out.assign(Period=pd.to_datetime(out["Period"], errors="coerce"))
-        .sort_values("Period")
-        .groupby(["ProjectID", "WBS"], as_index=False)
-        .tail(1)
+    # For each (ProjectID, WBS), take the latest Period row and validate KPI
+    # math. Period is "YYYY-MM" strings, which order lexicographically the
+    # same as dates, so no to_datetime pass is needed just to pick the max.
+    latest = out.loc[out.groupby(["ProjectID", "WBS"], observed=True)["Period"].idxmax()]
+
+    # Bulk KPI math over the latest rows (masking zero denominators) instead
+    # of a per-row isclose loop.
+    ev = latest["EV"].to_numpy(dtype=float)
+    ac = pd.to_numeric(latest["AC"], errors="coerce").fillna(0.0).to_numpy()
+    pv = pd.to_numeric(latest["PV"], errors="coerce").fillna(0.0).to_numpy()
+    cpi = latest["CPI"].to_numpy(dtype=float)
+    spi = latest["SPI"].to_numpy(dtype=float)
+
+    # Guard against divide-by-zero in assertions
+    m = ac > 0
+    np.testing.assert_allclose(cpi[m], ev[m] / ac[m], rtol=1e-6, atol=1e-9)
+    m = pv > 0
+    np.testing.assert_allclose(spi[m], ev[m] / pv[m], rtol=1e-6, atol=1e-9)
+
+    # Expect standard definition VAC = BAC - EAC (some pipelines may redefine — keep tolerance loose)
+    np.testing.assert_allclose(
+        latest["VAC"].to_numpy(dtype=float),
+        latest["BAC"].to_numpy(dtype=float) - latest["EAC"].to_numpy(dtype=float),
+        rtol=1e-6,
+        atol=1e-6,
     )
-
-    for _, row in latest.iterrows():
-        ev = float(row["EV"])
-        ac = float(row["AC"]) if row["AC"] not in (None, "") else 0.0
-        pv = float(row["PV"]) if row["PV"] not in (None, "") else 0.0
-        bac = float(row["BAC"])
-        eac = float(row["EAC"])
-        vac = float(row["VAC"])
-
-        # Guard against divide-by-zero in assertions
-        if ac > 0:
-            assert math.isclose(float(row["CPI"]), ev / ac, rel_tol=1e-6, abs_tol=1e-9)
-        if pv > 0:
-            assert math.isclose(float(row["SPI"]), ev / pv, rel_tol=1e-6, abs_tol=1e-9)
-
-        # Expect standard definition VAC = BAC - EAC (some pipelines may redefine — keep tolerance loose)
-        assert math.isclose(vac, bac - eac, rel_tol=1e-6, abs_tol=1e-6)
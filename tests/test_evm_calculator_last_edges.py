@@ -8,35 +8,13 @@
 
 from __future__ import annotations
 
-import numpy as np
 import pandas as pd
 
-from etl.evm_calculator import compute_metrics
 
-
-def test_compute_metrics_zero_pv_ac_and_nan_bac_on_latest() -> None:
-    # Schedule: two rows for the same WBS; latest has BAC = NaN to hit fallback
-    schedule_df = pd.DataFrame(
-        {
-            "ProjectID": ["Z1", "Z1"],
-            "WBS": ["W1", "W1"],
-            "PercentComplete": [0.4, 0.6],
-            "BAC": [10_000.0, np.nan],  # <- latest BAC NaN (forces fallback)
-        }
-    )
-
-    # Cost: two periods; the latest period has zeros to trigger CPI/SPI guards
-    cost_df = pd.DataFrame(
-        {
-            "ProjectID": ["Z1", "Z1"],
-            "WBS": ["W1", "W1"],
-            "Period": ["2025-01", "2025-02"],  # latest is 2025-02
-            "ActualCost": [2_000.0, 0.0],  # AC=0 on latest
-            "Budget": [2_500.0, 0.0],  # PV=0 on latest
-        }
-    )
-
-    out = compute_metrics(schedule_df, cost_df)
+def test_compute_metrics_zero_pv_ac_and_nan_bac_on_latest(evm_cases) -> None:
+    # "nan_bac_zero_latest" session case: BAC = NaN on the latest schedule row
+    # (EAC/VAC fallback) and PV = AC = 0 on the latest period (CPI/SPI guards).
+    out = evm_cases["nan_bac_zero_latest"]
     assert not out.empty
 
     # The latest row (2025-02) should have finite, numeric KPI values after guards
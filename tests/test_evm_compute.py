@@ -13,22 +13,18 @@ We validate:
 - VAC = BAC - EAC
 """
 
-import math
-
+import numpy as np
 import pandas as pd
 
-# Function under test
-from etl.evm_calculator import compute_metrics  # type: ignore[attr-defined]
-
 
-def test_compute_metrics_shapes_and_columns(schedule_df: pd.DataFrame, cost_df: pd.DataFrame) -> None:
+def test_compute_metrics_shapes_and_columns(evm_result: pd.DataFrame) -> None:
     """
     Ensures compute_metrics returns:
     - A non-empty DataFrame
     - Expected EVM columns present
     - Numeric columns have numeric dtype
     """
-    out = compute_metrics(schedule_df, cost_df)
+    out = evm_result
 
     # Must return a DataFrame with rows
     assert isinstance(out, pd.DataFrame)
@@ -53,57 +49,47 @@ def test_compute_metrics_shapes_and_columns(schedule_df: pd.DataFrame, cost_df:
     for col in required_cols:
         assert col in out.columns, f"Missing expected column: {col}"
 
-    # Numeric columns should be numeric dtype
+    # Numeric columns should be numeric dtype (dtype.kind is an O(1) check)
     numeric_cols = ["EV", "PV", "AC", "CPI", "SPI", "BAC", "EAC", "VAC", "CV", "SV"]
     for col in numeric_cols:
-        assert pd.api.types.is_numeric_dtype(out[col]), f"{col} should be numeric"
+        assert out[col].dtype.kind in "fiub", f"{col} should be numeric"
 
 
-def test_evm_math_consistency(schedule_df: pd.DataFrame, cost_df: pd.DataFrame) -> None:
+def test_evm_math_consistency(evm_result: pd.DataFrame) -> None:
     """
     Validates all EVM math relationships on the latest period per WBS.
     We use a small tolerance for floating-point comparisons.
     """
-    out = compute_metrics(schedule_df, cost_df).copy()
+    out = evm_result
 
-    # Normalize Period and take latest row per (ProjectID, WBS)
-    out["Period"] = pd.to_datetime(out["Period"], errors="coerce")
-    latest = out.sort_values("Period").groupby(["ProjectID", "WBS"], as_index=False).tail(1)
+    # Latest row per (ProjectID, WBS) via idxmax. compute_metrics emits
+    # Period as "YYYY-MM" strings, which order lexicographically like dates,
+    # so no object→datetime64 conversion is needed first.
+    latest = out.loc[out.groupby(["ProjectID", "WBS"], observed=True)["Period"].idxmax()]
 
     tol = 1e-6  # floating-point tolerance
 
-    for _, row in latest.iterrows():
-        ev = float(row["EV"])
-        pv = float(row["PV"])
-        ac = float(row["AC"])
-        bac = float(row["BAC"])
-
-        cpi = float(row["CPI"])
-        spi = float(row["SPI"])
-        eac = float(row["EAC"])
-        vac = float(row["VAC"])
-        cv = float(row["CV"])
-        sv = float(row["SV"])
-
-        # --- CPI / SPI
-        if ac != 0:
-            assert math.isclose(cpi, ev / ac, rel_tol=1e-6, abs_tol=tol)
-        else:
-            # if AC == 0, CPI is defined in code as 0 (safe-div), just ensure it's present
-            assert "CPI" in row
-
-        if pv != 0:
-            assert math.isclose(spi, ev / pv, rel_tol=1e-6, abs_tol=tol)
-        else:
-            # if PV == 0, SPI is defined in code as 0 (safe-div)
-            assert "SPI" in row
-
-        # --- CV / SV exact identities
-        assert math.isclose(cv, ev - ac, rel_tol=1e-6, abs_tol=tol)  # Cost Variance
-        assert math.isclose(sv, ev - pv, rel_tol=1e-6, abs_tol=tol)  # Schedule Variance
-
-        # --- EAC / VAC identities
-        # EAC = AC + (BAC - EV)  → quick estimate
-        assert math.isclose(eac, ac + (bac - ev), rel_tol=1e-6, abs_tol=tol)
-        # VAC = BAC - EAC
-        assert math.isclose(vac, bac - eac, rel_tol=1e-6, abs_tol=tol)
+    ev = latest["EV"].to_numpy(dtype=float)
+    pv = latest["PV"].to_numpy(dtype=float)
+    ac = latest["AC"].to_numpy(dtype=float)
+    bac = latest["BAC"].to_numpy(dtype=float)
+    eac = latest["EAC"].to_numpy(dtype=float)
+    vac = latest["VAC"].to_numpy(dtype=float)
+    cv = latest["CV"].to_numpy(dtype=float)
+    sv = latest["SV"].to_numpy(dtype=float)
+
+    # --- CPI / SPI (zero denominators are safe-divved in code; mask them out)
+    m = ac != 0
+    np.testing.assert_allclose(latest["CPI"].to_numpy(dtype=float)[m], ev[m] / ac[m], rtol=1e-6, atol=tol)
+    m = pv != 0
+    np.testing.assert_allclose(latest["SPI"].to_numpy(dtype=float)[m], ev[m] / pv[m], rtol=1e-6, atol=tol)
+
+    # --- CV / SV exact identities
+    np.testing.assert_allclose(cv, ev - ac, rtol=1e-6, atol=tol)  # Cost Variance
+    np.testing.assert_allclose(sv, ev - pv, rtol=1e-6, atol=tol)  # Schedule Variance
+
+    # --- EAC / VAC identities
+    # EAC = AC + (BAC - EV)  → quick estimate
+    np.testing.assert_allclose(eac, ac + (bac - ev), rtol=1e-6, atol=tol)
+    # VAC = BAC - EAC
+    np.testing.assert_allclose(vac, bac - eac, rtol=1e-6, atol=tol)
@@ -1,14 +1,5 @@
-from pathlib import Path
-
-import pandas as pd
-
-from services.evm_metrics import compute_kpis
-
-
-def test_p50_like_eac_demo():
-    df = pd.read_csv(Path("data/samples/evm_sample.csv"))
-    out = compute_kpis(df)
-    last = out.iloc[-1]
+def test_p50_like_eac_demo(evm_sample_kpis):
+    last = evm_sample_kpis.iloc[-1]
 
     # Ground truth from the sample
     ev, ac, bac = 260000.0, 295000.0, 300000.0
@@ -38,7 +38,7 @@ def _write_minimal_evm(processed_dir: Path):
         }
     )
     processed_dir.mkdir(parents=True, exist_ok=True)
-    (processed_dir / "evm_timeseries.parquet").write_bytes(df.to_parquet(index=False) or b"")
+    df.to_parquet(processed_dir / "evm_timeseries.parquet", index=False, compression=None)
 
 
 def _write_minimal_risk_register(samples_dir: Path):
@@ -87,6 +87,26 @@ def test_run_with_missing_procurement_uses_defaults(tmp_path: Path):
     assert (outdir / "forecast_s_curves.parquet").exists()
 
 
+def test_run_with_zero_iterations_writes_empty_outputs(tmp_path: Path):
+    # --iters 0 is accepted by the CLI: the run must still produce all three
+    # outputs, just with zero rows and the full column schema.
+    processed = tmp_path / "data" / "processed"
+    samples = tmp_path / "data" / "samples"
+    outdir = tmp_path / "out0"
+
+    _write_minimal_evm(processed)
+    _write_minimal_risk_register(samples)
+
+    run(iters=0, seed=123, processed_dir=str(processed), samples_dir=str(samples), outdir=str(outdir))
+
+    runs = pd.read_parquet(outdir / "monte_carlo_runs.parquet")
+    assert runs.empty and list(runs.columns) == ["ProjectID", "EAC", "FinishDaysOverBaseline"]
+    summ = pd.read_parquet(outdir / "monte_carlo_summary.parquet")
+    assert summ.empty and "EAC_P80" in summ.columns
+    sc = pd.read_parquet(outdir / "forecast_s_curves.parquet")
+    assert sc.empty and list(sc.columns) == ["ProjectID", "Metric", "Value", "CDF"]
+
+
 def test_run_with_procurement_file_branch(tmp_path: Path):
     processed = tmp_path / "data" / "processed"
     samples = tmp_path / "data" / "samples"
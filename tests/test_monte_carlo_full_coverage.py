@@ -2,7 +2,6 @@ from pathlib import Path
 
 import pandas as pd
 
-import etl.monte_carlo as mc  # import module to monkeypatch inside it
 from etl.monte_carlo import run
 
 
@@ -25,7 +24,7 @@ def _write_evm_with_nan_eac(processed_dir: Path):
         }
     )
     processed_dir.mkdir(parents=True, exist_ok=True)
-    (processed_dir / "evm_timeseries.parquet").write_bytes(df.to_parquet(index=False) or b"")
+    df.to_parquet(processed_dir / "evm_timeseries.parquet", index=False, compression=None)
 
 
 def _write_risks(samples_dir: Path):
@@ -45,7 +44,7 @@ def _write_risks(samples_dir: Path):
     (samples_dir / "risk_register.csv").write_text(risks.to_csv(index=False), encoding="utf-8")
 
 
-def test_mc_fallback_eac_to_bac_and_empty_procurement(tmp_path: Path, monkeypatch):
+def test_mc_fallback_eac_to_bac_and_empty_procurement(tmp_path: Path):
     processed = tmp_path / "data" / "processed"
     samples = tmp_path / "data" / "samples"
     outdir = tmp_path / "out_mc_full"
@@ -53,27 +52,12 @@ def test_mc_fallback_eac_to_bac_and_empty_procurement(tmp_path: Path, monkeypatc
     _write_evm_with_nan_eac(processed)
     _write_risks(samples)
 
-    # Create an empty procurement.csv file so the exists() check is True
+    # Header-only procurement.csv: the exists() check is True but the typed
+    # Arrow read yields zero rows, driving the empty-delays default branch.
+    # (No monkeypatching needed — the reader handles the empty file directly.)
     samples.mkdir(parents=True, exist_ok=True)
     (samples / "procurement.csv").write_text("PlannedDelivery,ActualDelivery\n", encoding="utf-8")
 
-    # Monkeypatch pd.read_csv inside etl.monte_carlo so that ONLY the procurement file
-    # returns an *empty* DataFrame with datetime64 dtypes, making `.dt.days` valid.
-    orig_read_csv = mc.pd.read_csv
-
-    def patched_read_csv(path, *args, **kwargs):
-        path = Path(path)
-        if path.name == "procurement.csv":
-            return pd.DataFrame(
-                {
-                    "PlannedDelivery": pd.to_datetime([], errors="coerce"),
-                    "ActualDelivery": pd.to_datetime([], errors="coerce"),
-                }
-            )
-        return orig_read_csv(path, *args, **kwargs)
-
-    monkeypatch.setattr(mc.pd, "read_csv", patched_read_csv)
-
     run(iters=16, seed=7, processed_dir=str(processed), samples_dir=str(samples), outdir=str(outdir))
 
     # Outputs exist → both branches executed (EAC fallback + empty procurement)
@@ -24,7 +24,7 @@ def _write_minimal_evm(processed_dir: Path):
         }
     )
     processed_dir.mkdir(parents=True, exist_ok=True)
-    (processed_dir / "evm_timeseries.parquet").write_bytes(df.to_parquet(index=False) or b"")
+    df.to_parquet(processed_dir / "evm_timeseries.parquet", index=False, compression=None)
 
 
 def _write_risks_missing_cols(samples_dir: Path):
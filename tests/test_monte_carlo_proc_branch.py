@@ -82,6 +82,7 @@ def test_monte_carlo_with_procurement_branch(tmp_path: Path) -> None:
     # And they’re non-empty
     import pandas as pd
 
-    assert len(pd.read_parquet(outdir / "monte_carlo_runs.parquet")) > 0
-    assert len(pd.read_parquet(outdir / "monte_carlo_summary.parquet")) > 0
-    assert len(pd.read_parquet(outdir / "forecast_s_curves.parquet")) > 0
+    # Only the row count matters here, so read a single column per file
+    assert len(pd.read_parquet(outdir / "monte_carlo_runs.parquet", columns=["ProjectID"])) > 0
+    assert len(pd.read_parquet(outdir / "monte_carlo_summary.parquet", columns=["ProjectID"])) > 0
+    assert len(pd.read_parquet(outdir / "forecast_s_curves.parquet", columns=["ProjectID"])) > 0
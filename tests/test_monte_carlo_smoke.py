@@ -2,16 +2,16 @@
 tests/test_monte_carlo_smoke.py
 
 Tiny, fast smoke test for the Monte Carlo engine with schema + sanity checks.
-This version clears sys.modules to avoid the runpy RuntimeWarning.
 """
 
-import runpy  # Execute a module as if via `python -m`
-import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from etl.monte_carlo import run as mc_run
+
 
 def _write_minimal_inputs(processed: Path, samples: Path) -> None:
     """
@@ -28,7 +28,7 @@ def _write_minimal_inputs(processed: Path, samples: Path) -> None:
             "BAC": [1_100_000.0, 1_100_000.0],
         }
     )
-    (processed / "evm_timeseries.parquet").write_bytes(evm.to_parquet(index=False) or b"")
+    evm.to_parquet(processed / "evm_timeseries.parquet", index=False, compression=None)
 
     # Risk register CSV: minimal numeric PERT + Probability
     risks = pd.DataFrame(
@@ -57,9 +57,11 @@ def _write_minimal_inputs(processed: Path, samples: Path) -> None:
     procurement.to_csv(samples / "procurement.csv", index=False)
 
 
-def test_monte_carlo_cli_runs_inprocess(tmp_path: Path, monkeypatch) -> None:
+def test_monte_carlo_cli_runs_inprocess(tmp_path: Path) -> None:
     """
-    Smoke test: run `etl.monte_carlo` in-process with tiny params and validate outputs.
+    Smoke test: run the Monte Carlo driver in-process with tiny params and
+    validate outputs. Calls run() directly — the __main__ block is a thin
+    argparse wrapper around it, so no module re-execution under runpy.
     """
     # Arrange: temp input/output dirs
     processed = tmp_path / "processed"
@@ -67,27 +69,8 @@ def test_monte_carlo_cli_runs_inprocess(tmp_path: Path, monkeypatch) -> None:
     outdir = tmp_path / "out"
     _write_minimal_inputs(processed, samples)
 
-    # Arrange: CLI argv for argparse in __main__
-    argv = [
-        "etl.monte_carlo",
-        "--iters",
-        "50",
-        "--seed",
-        "42",
-        "--processed",
-        str(processed),
-        "--samples",
-        str(samples),
-        "--outdir",
-        str(outdir),
-    ]
-    monkeypatch.setattr(sys, "argv", argv, raising=True)
-
-    # NEW: ensure a clean import state so runpy doesn't warn
-    sys.modules.pop("etl.monte_carlo", None)  # remove if already imported
-
-    # Act: execute module as if `python -m etl.monte_carlo`
-    runpy.run_module("etl.monte_carlo", run_name="__main__")
+    # Act: same orchestration as `python -m etl.monte_carlo`
+    mc_run(iters=50, seed=42, processed_dir=str(processed), samples_dir=str(samples), outdir=str(outdir))
 
     # Assert: files exist
     runs_fp = outdir / "monte_carlo_runs.parquet"
@@ -97,21 +80,23 @@ def test_monte_carlo_cli_runs_inprocess(tmp_path: Path, monkeypatch) -> None:
     assert summ_fp.exists()
     assert scur_fp.exists()
 
-    # Assert: schemas + basic sanity
-    runs = pd.read_parquet(runs_fp)
-    assert {"ProjectID", "EAC", "FinishDaysOverBaseline"}.issubset(runs.columns)
+    # Assert: schemas + basic sanity. Projecting with columns= both cuts the
+    # read to what the assertions touch and enforces the schema — pyarrow
+    # raises if a requested column is missing from the file.
+    # dtype_backend="pyarrow" keeps the decoded columns as Arrow-extension
+    # arrays (no Arrow→NumPy conversion); the assertions only compare values.
+    runs = pd.read_parquet(runs_fp, columns=["ProjectID", "EAC", "FinishDaysOverBaseline"], dtype_backend="pyarrow")
     assert len(runs) > 0
 
-    summary = pd.read_parquet(summ_fp)
-    expected_cols = {"ProjectID", "EAC_P10", "EAC_P50", "EAC_P80", "Finish_P10", "Finish_P50", "Finish_P80"}
-    assert expected_cols.issubset(summary.columns)
+    expected_cols = ["ProjectID", "EAC_P10", "EAC_P50", "EAC_P80", "Finish_P10", "Finish_P50", "Finish_P80"]
+    summary = pd.read_parquet(summ_fp, columns=expected_cols, dtype_backend="pyarrow")
     row = summary.iloc[0]
     assert row["EAC_P10"] <= row["EAC_P50"] <= row["EAC_P80"]
     assert row["Finish_P10"] <= row["Finish_P50"] <= row["Finish_P80"]
 
-    sc = pd.read_parquet(scur_fp)
-    assert {"ProjectID", "Metric", "Value", "CDF"}.issubset(sc.columns)
-    assert (sc["CDF"] >= 0).all() and (sc["CDF"] <= 1).all()
+    sc = pd.read_parquet(scur_fp, columns=["ProjectID", "Metric", "Value", "CDF"], dtype_backend="pyarrow")
+    cdf = sc["CDF"].to_numpy()
+    assert cdf.min() >= 0.0 and cdf.max() <= 1.0
     for (_, _), grp in sc.groupby(["ProjectID", "Metric"]):
         g = grp.sort_values("Value")
-        assert (g["CDF"].diff().fillna(0) >= -1e-9).all()
+        assert np.all(np.diff(g["CDF"].to_numpy()) >= -1e-9)
@@ -4,25 +4,23 @@ Smoke + output assertion for etl.p6_ingest (CLI)
 What this test does:
 - Creates the exact input file the CLI expects at data/samples/schedule_activities.csv
   with the date columns p6_ingest parses.
-- Runs `etl.p6_ingest` as if `python -m etl.p6_ingest`.
-- Asserts the CLI writes data/processed/schedule.parquet.
+- Calls etl.p6_ingest.main directly with explicit paths (the __main__ block
+  is a thin argparse wrapper around it).
+- Asserts the expected schedule.parquet is written.
 - (Light) Validates row count and a couple of key columns exist.
 """
 
-import runpy
-import sys
-
 import pandas as pd
 
+from etl.p6_ingest import main as p6_main
+
 
-def test_p6_ingest_cli_runs_and_writes_parquet(tmp_path, monkeypatch):
+def test_p6_ingest_cli_runs_and_writes_parquet(tmp_path):
     """
     Arrange:
       - Create temp repo root with `data/samples/schedule_activities.csv`
     Act:
-      - chdir into temp root
-      - reset sys.argv so argparse in the module doesn’t see pytest flags
-      - run `etl.p6_ingest` as __main__
+      - call etl.p6_ingest.main with explicit samples/processed paths
     Assert:
       - `data/processed/schedule.parquet` is written
       - parquet has expected rows and columns
@@ -44,21 +42,14 @@ def test_p6_ingest_cli_runs_and_writes_parquet(tmp_path, monkeypatch):
         }
     ).to_csv(csv_fp, index=False)
 
-    # 2) Run from the temp root so relative defaults resolve:
-    #    --samples=data/samples  --out=data/processed
-    monkeypatch.chdir(tmp_path)
-
-    # 3) Critical: scrub pytest flags so argparse inside the module doesn’t choke
-    monkeypatch.setattr(sys, "argv", ["etl.p6_ingest"])
-
-    # 4) Execute like: python -m etl.p6_ingest
-    runpy.run_module("etl.p6_ingest", run_name="__main__")
+    # 2) Run with explicit paths (same orchestration as `python -m etl.p6_ingest`)
+    p6_main(samples_dir, tmp_path / "data" / "processed")
 
-    # 5) Assert the expected output parquet exists
+    # 3) Assert the expected output parquet exists
     out_fp = tmp_path / "data" / "processed" / "schedule.parquet"
     assert out_fp.exists(), "p6_ingest should write data/processed/schedule.parquet"
 
-    # 6) (Light) Validate the parquet content
+    # 4) (Light) Validate the parquet content
     out_df = pd.read_parquet(out_fp)
     assert len(out_df) == 2, "output should preserve row count from input"
     for col in ["ActivityID", "Name", "BaselineStart", "BaselineFinish", "Start", "Finish"]:
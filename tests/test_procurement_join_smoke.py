@@ -2,22 +2,22 @@
 tests/test_procurement_join_smoke.py
 
 Purpose:
-- Smoke test for `etl.procurement_join` run as a CLI module.
+- Smoke test for `etl.procurement_join` called directly (the __main__ block
+  is a thin argparse wrapper around main()).
 - Include Qty and UnitCost columns in procurement.csv because the module
   uses them to compute DelayCost.
-- Reset sys.argv so pytest flags don't break argparse.
 
 What it solves:
 - KeyError: 'Qty'
 """
 
-import runpy
-import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
 import pandas as pd
 
+from etl.procurement_join import main as procurement_main
+
 
 def _write_inputs(root: Path) -> None:
     """Create minimal EVM parquet and procurement.csv inputs (with Qty/UnitCost)."""
@@ -37,7 +37,7 @@ def _write_inputs(root: Path) -> None:
             "PV": [1000.0, 2000.0],
         }
     )
-    (processed / "evm_timeseries.parquet").write_bytes(evm.to_parquet(index=False) or b"")
+    evm.to_parquet(processed / "evm_timeseries.parquet", index=False, compression=None)
 
     today = datetime(2025, 1, 1)
     proc = pd.DataFrame(
@@ -55,17 +55,13 @@ def _write_inputs(root: Path) -> None:
     proc.to_csv(samples / "procurement.csv", index=False)
 
 
-def test_procurement_join_cli_runs(tmp_path, monkeypatch):
+def test_procurement_join_cli_runs(tmp_path):
     """Run `etl.procurement_join` in a temp workspace and verify output parquet exists."""
     root = tmp_path
     _write_inputs(root)
-    monkeypatch.chdir(root)
-
-    # Remove pytest's flags for argparse in the module
-    monkeypatch.setattr(sys, "argv", ["etl.procurement_join"])
 
-    # Execute like: python -m etl.procurement_join
-    runpy.run_module("etl.procurement_join", run_name="__main__")
+    # Same orchestration as `python -m etl.procurement_join`, explicit paths
+    procurement_main(root / "data" / "samples", root / "data" / "processed")
 
     out_fp = root / "data" / "processed" / "procurement_impacts.parquet"
     assert out_fp.exists(), "Expected procurement_impacts.parquet to be generated"